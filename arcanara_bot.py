@@ -1,29 +1,39 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
 import re
 import random
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from functools import lru_cache, wraps
 from discord.errors import NotFound as DiscordNotFound
+import threading
 import time
 import json
 from pathlib import Path
 import os
-import psycopg
 from datetime import datetime, date
+from itertools import accumulate
 import traceback
 from zoneinfo import ZoneInfo
-from psycopg.types.json import Json
-from psycopg.rows import dict_row
-from typing import Dict, Any, List, Optional
+from psycopg.rows import dict_row, scalar_row
+from psycopg_pool import ConnectionPool
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+try:
+    import orjson
+    ORJSON_OK = True
+except Exception:
+    ORJSON_OK = False
 from card_images import make_image_attachment  # uses assets/cards/rws_stx/ etc.
 print("✅ Arcanara boot: VERSION 2025-12-21-TopGG-1")
 
-MYSTERY_STATE: Dict[int, Dict[str, Any]] = {}
-
 # ==============================
 # CONFIGURATION
 # ==============================
+BASE_DIR = Path(__file__).resolve().parent
+
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 if not BOT_TOKEN:
     raise ValueError("❌ BOT_TOKEN environment variable not found. Please set it in your host environment settings.")
@@ -37,19 +47,32 @@ if not DATABASE_URL:
 
 _DB_READY = False  # prevents re-creating tables multiple times
 
+# One shared pool: commands borrow a warm connection instead of paying the
+# TCP + TLS + auth handshake to Render Postgres on every call. Connections are
+# health-checked on checkout and recycled every 30 minutes so a server-side
+# idle timeout never hands a dead socket to a command.
+DB_POOL = ConnectionPool(
+    DATABASE_URL,
+    min_size=2,
+    max_size=20,
+    timeout=10,
+    max_lifetime=1800,
+    check=ConnectionPool.check_connection,
+    kwargs={"row_factory": dict_row, "connect_timeout": 10},
+    open=True,
+)
+
 
 def db_connect():
-    return psycopg.connect(
-        DATABASE_URL,
-        row_factory=dict_row,
-        connect_timeout=10,
-    )
+    """Borrow a pooled connection (use as `with db_connect() as conn:`)."""
+    return DB_POOL.connection()
 
 
 def ensure_tables():
     """Create tables if they don't exist (safe to run on startup)."""
     with db_connect() as conn:
-        with conn.cursor() as cur:
+        # Pipelined: the DDL below goes out in one batch instead of one round trip each
+        with conn.pipeline(), conn.cursor() as cur:
             # Existing table: user tone preference
             cur.execute(
                 """
@@ -130,6 +153,7 @@ def ensure_tables():
                 """
             )
 
+            # Leading user_id also serves /forgetme's per-user DELETE
             cur.execute(
                 """
                 CREATE INDEX IF NOT EXISTS idx_tarot_history_user_time
@@ -137,29 +161,104 @@ def ensure_tables():
                 """
             )
 
+            # Seekers Arcanara has greeted before (used by /insight)
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tarot_seekers (
+                    user_id BIGINT PRIMARY KEY,
+                    name TEXT,
+                    first_seen TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                );
+                """
+            )
+
         conn.commit()
 
 
+# ==============================
+# IN-PROCESS USER CACHES
+# ==============================
+# Tone + settings are read on nearly every command but only change via
+# /tone, /shuffle, /settings and /forgetme, so keep a short-lived copy in
+# memory. Writes go through to the cache; entries expire after SETTINGS_TTL.
+SETTINGS_TTL = 300.0
+
+
+class TTLDict:
+    """
+    Size-capped dict whose entries expire after `ttl` seconds.
+    Least recently used entries are evicted first once `maxsize` is reached.
+    Guarded by a lock so worker threads (asyncio.to_thread) can share it.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[int, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: int, default: Any = None) -> Any:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return default
+            expires_at, value = hit
+            if time.monotonic() >= expires_at:
+                self._data.pop(key, None)
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: int, default: Any = None) -> Any:
+        with self._lock:
+            hit = self._data.pop(key, None)
+        return default if hit is None else hit[1]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_TONE_CACHE = TTLDict(maxsize=10_000, ttl=SETTINGS_TTL)
+_SETTINGS_CACHE = TTLDict(maxsize=10_000, ttl=SETTINGS_TTL)
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    _TONE_CACHE.pop(user_id, None)
+    _SETTINGS_CACHE.pop(user_id, None)
+
+
+# Unrevealed /mystery picks: {"card": <card dict>, "is_reversed": bool}.
+# A pick that isn't revealed within the hour is dropped.
+MYSTERY_STATE = TTLDict(maxsize=10_000, ttl=3600.0)
+
+
 # ==============================
 # TAROT TONES (DB-backed)
 # ==============================
 DEFAULT_TONE = "poetic"
 
 TONE_SPECS = {
-    "quick": ["voice_pulse", "call_to_action"],
-    "poetic": ["voice_lead", "meaning", "voice_pulse", "mantra", "voice_turn", "call_to_action"],
+    "quick": ("voice_pulse", "call_to_action"),
+    "poetic": ("voice_lead", "meaning", "voice_pulse", "mantra", "voice_turn", "call_to_action"),
 
 
-    "direct": ["reader_voice", "tell", "do_dont", "prescription", "watch_for", "pitfall", "questions", "next_24h", "call_to_action"],
-    "shadow": ["reader_voice", "tell", "shadow", "watch_for", "pitfall", "questions", "call_to_action"],
+    "direct": ("reader_voice", "tell", "do_dont", "prescription", "watch_for", "pitfall", "questions", "next_24h", "call_to_action"),
+    "shadow": ("reader_voice", "tell", "shadow", "watch_for", "pitfall", "questions", "call_to_action"),
 
-    "love":   ["reader_voice", "tell", "relationships", "green_red", "pitfall", "questions", "call_to_action"],
-    "work":   ["reader_voice", "tell", "work", "prescription", "watch_for", "next_24h", "call_to_action"],
-    "money":  ["reader_voice", "tell", "money", "prescription", "watch_for", "next_24h", "call_to_action"],
+    "love":   ("reader_voice", "tell", "relationships", "green_red", "pitfall", "questions", "call_to_action"),
+    "work":   ("reader_voice", "tell", "work", "prescription", "watch_for", "next_24h", "call_to_action"),
+    "money":  ("reader_voice", "tell", "money", "prescription", "watch_for", "next_24h", "call_to_action"),
 
-    "full": ["voice_lead", "reader_voice", "tell", "meaning", "voice_pulse", "mantra", "do_dont",
+    "full": ("voice_lead", "reader_voice", "tell", "meaning", "voice_pulse", "mantra", "do_dont",
          "prescription", "watch_for", "pitfall", "shadow", "green_red", "questions",
-         "next_24h", "voice_turn", "call_to_action"],
+         "next_24h", "voice_turn", "call_to_action"),
 
 }
 
@@ -188,22 +287,36 @@ async def _safe_autocomplete(self, choices):
 discord.InteractionResponse.autocomplete = _safe_autocomplete
 
 def normalize_tone(tone: str) -> str:
-    t = (tone or "").lower().strip()
+    # Most callers already hold a canonical tone (or nothing at all)
+    if tone in TONE_SPECS:
+        return tone
+    if not tone:
+        return DEFAULT_TONE
+    t = tone.lower().strip()
     return t if t in TONE_SPECS else DEFAULT_TONE
 
 def tone_label(tone: str) -> str:
-    t = normalize_tone(tone)
-    return TONE_LABELS.get(t, TONE_LABELS[DEFAULT_TONE])
+    # Handlers pass already-normalized tones, so try the table directly first
+    label = TONE_LABELS.get(tone)
+    if label is not None:
+        return label
+    return TONE_LABELS.get(normalize_tone(tone), TONE_LABELS[DEFAULT_TONE])
 
 def get_effective_tone(user_id: int, tone_override: Optional[str] = None) -> str:
     return normalize_tone(tone_override) if tone_override else get_user_tone(user_id)
 
 def get_user_tone(user_id: int) -> str:
+    cached = _TONE_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+
     with db_connect() as conn:
-        with conn.cursor() as cur:
-            cur.execute("SELECT tone FROM tarot_user_prefs WHERE user_id=%s", (user_id,))
-            row = cur.fetchone()
-    return normalize_tone(row["tone"]) if row else DEFAULT_TONE
+        with conn.cursor(row_factory=scalar_row) as cur:
+            cur.execute("SELECT tone FROM tarot_user_prefs WHERE user_id=%s", (user_id,), prepare=True)
+            stored = cur.fetchone()
+    tone = normalize_tone(stored) if stored else DEFAULT_TONE
+    _TONE_CACHE[user_id] = tone
+    return tone
 
 def set_user_tone(user_id: int, tone: str) -> str:
     t = normalize_tone(tone)
@@ -215,8 +328,9 @@ def set_user_tone(user_id: int, tone: str) -> str:
                 ON CONFLICT (user_id) DO UPDATE SET
                     tone = EXCLUDED.tone,
                     updated_at = NOW()
-            """, (user_id, t))
+            """, (user_id, t), prepare=True)
         conn.commit()
+    _TONE_CACHE[user_id] = t
     return t
 
 def reset_user_tone(user_id: int) -> str:
@@ -224,11 +338,17 @@ def reset_user_tone(user_id: int) -> str:
         with conn.cursor() as cur:
             cur.execute("DELETE FROM tarot_user_prefs WHERE user_id=%s", (user_id,))
         conn.commit()
+    _TONE_CACHE[user_id] = DEFAULT_TONE
     return DEFAULT_TONE
 
 
 def _clip(text: str, max_len: int = 3800) -> str:
-    text = (text or "").strip()
+    if not text:
+        return ""
+    # Common case: already short and trimmed
+    if len(text) <= max_len and not (text[0].isspace() or text[-1].isspace()):
+        return text
+    text = text.strip()
     if len(text) <= max_len:
         return text
     return text[: max_len - 1] + "…"
@@ -256,10 +376,90 @@ def _get_orientation_data(card: dict, orientation: str) -> dict:
     return {}
 
 
-def render_card_text(card: Dict[str, Any], orientation: str, tone: str) -> str:
-    tone = normalize_tone(tone)
-    spec = TONE_SPECS.get(tone, TONE_SPECS[DEFAULT_TONE])
+class CardParts(NamedTuple):
+    """The pieces of one card + orientation that the token renderers draw from."""
+    card: Dict[str, Any]
+    dg: Dict[str, Any]
+    lenses: Dict[str, Any]
+    meaning: str
+    v_lead: str
+    v_pulse: str
+    v_turn: str
+
+
+def _labeled(label: str, value: Any) -> str:
+    return f"**{label}:** {value}" if value else ""
+
+
+def _italic(value: Any) -> str:
+    return f"*{value}*" if value else ""
+
+
+def _render_do_dont(p: CardParts) -> str:
+    do = p.dg.get("do", "")
+    dont = p.dg.get("dont", "")
+    if do and dont:
+        return f"**Do:** {do}\n**Don't:** {dont}"
+    return do or dont
+
+
+def _render_questions(p: CardParts) -> str:
+    qs = p.dg.get("questions", []) or []
+    qs = [q for q in qs if isinstance(q, str) and q.strip()]
+    return "**Ask:** " + " | ".join(qs[:3]) if qs else ""
+
+
+def _render_green_red(p: CardParts) -> str:
+    gf = p.dg.get("green_flag", "")
+    rf = p.dg.get("red_flag", "")
+    line = []
+    if gf:
+        line.append(f"**Green flag:** {gf}")
+    if rf:
+        line.append(f"**Red flag:** {rf}")
+    return "\n".join(line)
+
+
+def _render_lens(key: str, label: str):
+    return lambda p: _labeled(label, p.lenses.get(key) or p.dg.get(key, ""))
+
+
+# One renderer per TONE_SPECS token; each returns "" when it has nothing to add
+RENDERERS = {
+    "meaning": lambda p: p.meaning,
+    "mantra": lambda p: _labeled("Mantra", p.dg.get("mantra", "")),
+    "quick": lambda p: p.dg.get("quick", ""),
+    "do": lambda p: _labeled("Do", p.dg.get("do", "")),
+    "do_dont": _render_do_dont,
+    "watch_for": lambda p: _labeled("Watch for", p.dg.get("watch_for", "")),
+    "shadow": lambda p: _labeled("Shadow", p.dg.get("shadow", "")),
+    "questions": _render_questions,
+    "next_24h": lambda p: _labeled("Next 24h", p.dg.get("next_24h", "")),
+    "relationships": _render_lens("relationships", "Love/People"),
+    "work": _render_lens("work", "Work"),
+    "money": _render_lens("money", "Money"),
+    # ---- v2 fields ----
+    "tell": lambda p: _labeled("The truth", p.dg.get("tell", "")),
+    "prescription": lambda p: _labeled("Do this", p.dg.get("prescription", "")),
+    "pitfall": lambda p: _labeled("Pitfall", p.dg.get("pitfall", "")),
+    "green_red": _render_green_red,
+    "reader_voice": lambda p: _italic(p.dg.get("reader_voice", "")),
+    "poetic_hint": lambda p: "" if (p.v_lead or p.v_pulse or p.v_turn) else _italic(p.dg.get("poetic_hint", "")),
+    "voice_lead": lambda p: _italic(p.v_lead),
+    "voice_pulse": lambda p: _italic(p.v_pulse),
+    "voice_turn": lambda p: _italic(p.v_turn),
+    "call_to_action": lambda p: _labeled("Action", p.card.get("call_to_action", "")),
+}
+
 
+# Each tone's token list, minus any token without a renderer
+TONE_TOKENS = {
+    tone: tuple(token for token in spec if token in RENDERERS)
+    for tone, spec in TONE_SPECS.items()
+}
+
+
+def card_parts(card: Dict[str, Any], orientation: str) -> CardParts:
     is_rev = orientation.strip().lower().startswith("r")
     okey = "reversed" if is_rev else "upright"
 
@@ -289,139 +489,62 @@ def render_card_text(card: Dict[str, Any], orientation: str, tone: str) -> str:
     dg = card.get("direct_guidance", {}) or {}
     lenses = dg.get("lenses", {}) or {}
 
-    def do_dont():
-        do = dg.get("do", "")
-        dont = dg.get("dont", "")
-        if do and dont:
-            return f"**Do:** {do}\n**Don't:** {dont}"
-        return do or dont
-
-    def questions():
-        qs = dg.get("questions", []) or []
-        qs = [q for q in qs if isinstance(q, str) and q.strip()]
-        return "**Ask:** " + " | ".join(qs[:3]) if qs else ""
-
-    blocks = []
-    for token in spec:
-        if token == "meaning":
-            blocks.append(meaning)
-
-        elif token == "mantra":
-            m = dg.get("mantra", "")
-            if m:
-                blocks.append(f"**Mantra:** {m}")
-
-        elif token == "quick":
-            q = dg.get("quick", "")
-            if q:
-                blocks.append(q)
-
-        elif token == "do":
-            d = dg.get("do", "")
-            if d:
-                blocks.append(f"**Do:** {d}")
-
-        elif token == "do_dont":
-            dd = do_dont()
-            if dd:
-                blocks.append(dd)
-
-        elif token == "watch_for":
-            w = dg.get("watch_for", "")
-            if w:
-                blocks.append(f"**Watch for:** {w}")
-
-        elif token == "shadow":
-            s = dg.get("shadow", "")
-            if s:
-                blocks.append(f"**Shadow:** {s}")
-
-        elif token == "questions":
-            qs = questions()
-            if qs:
-                blocks.append(qs)
-
-        elif token == "next_24h":
-            n = dg.get("next_24h", "")
-            if n:
-                blocks.append(f"**Next 24h:** {n}")
-
-        elif token == "relationships":
-            txt = lenses.get("relationships") or dg.get("relationships", "")
-            if txt:
-                blocks.append(f"**Love/People:** {txt}")
-
-        elif token == "work":
-            txt = lenses.get("work") or dg.get("work", "")
-            if txt:
-                blocks.append(f"**Work:** {txt}")
-
-        elif token == "money":
-            txt = lenses.get("money") or dg.get("money", "")
-            if txt:
-                blocks.append(f"**Money:** {txt}")
-
-        # ---- v2 fields ----
-        elif token == "tell":
-            t = dg.get("tell", "")
-            if t:
-                blocks.append(f"**The truth:** {t}")
-
-        elif token == "prescription":
-            p = dg.get("prescription", "")
-            if p:
-                blocks.append(f"**Do this:** {p}")
-
-        elif token == "pitfall":
-            p = dg.get("pitfall", "")
-            if p:
-                blocks.append(f"**Pitfall:** {p}")
-
-        elif token == "green_red":
-            gf = dg.get("green_flag", "")
-            rf = dg.get("red_flag", "")
-            if gf or rf:
-                line = []
-                if gf:
-                    line.append(f"**Green flag:** {gf}")
-                if rf:
-                    line.append(f"**Red flag:** {rf}")
-                blocks.append("\n".join(line))
-
-        elif token == "reader_voice":
-            rv = dg.get("reader_voice", "")
-            if rv:
-                blocks.append(f"*{rv}*")
-
-        elif token == "poetic_hint":
-            ph = dg.get("poetic_hint", "")
-            if ph and not (v_lead or v_pulse or v_turn):
-                blocks.append(f"*{ph}*")
-
-        elif token == "voice_lead":
-            if v_lead:
-                blocks.append(f"*{v_lead}*")
-
-        elif token == "voice_pulse":
-            if v_pulse:
-                blocks.append(f"*{v_pulse}*")
-
-        elif token == "voice_turn":
-            if v_turn:
-                blocks.append(f"*{v_turn}*")
-
-        elif token == "call_to_action":
-            a = card.get("call_to_action", "")
-            if a:
-                blocks.append(f"**Action:** {a}")
-
-    return _clip("\n\n".join(blocks))
+    return CardParts(card, dg, lenses, meaning, v_lead, v_pulse, v_turn)
+
+
+def prerender_blocks(card: Dict[str, Any], orientation: str) -> Dict[str, str]:
+    """
+    Token blocks for one card + orientation, keyed by token. The meaning is
+    always kept ("—" when the card has none); other blocks only when non-empty.
+    """
+    parts = card_parts(card, orientation)
+    blocks = {}
+    for token, render in RENDERERS.items():
+        block = render(parts)
+        if block or token == "meaning":
+            blocks[token] = block
+    return blocks
+
+
+def _join_blocks(blocks: Dict[str, str], tone: str, max_len: int = 3800) -> str:
+    # Stop picking blocks once the text is past the budget; _clip drops the rest anyway
+    picked = []
+    total = -2
+    for token in TONE_TOKENS[tone]:
+        block = blocks.get(token)
+        if block is None:
+            continue
+        picked.append(block)
+        total += len(block) + 2
+        if total > max_len and len("\n\n".join(picked).strip()) > max_len:
+            break
+    return _clip("\n\n".join(picked), max_len)
+
+
+@lru_cache(maxsize=4096)
+def _render_cached(card_idx: int, orientation: str, tone: str, max_len: int) -> str:
+    return _join_blocks(PRERENDERED[card_idx][orientation], tone, max_len)
+
+
+def render_card_text(card: Dict[str, Any], orientation: str, tone: str, max_len: int = 3800) -> str:
+    # Deck cards are immutable: their blocks are prerendered at load and the
+    # joined text is memoized per (card, orientation, tone, max_len)
+    tone = normalize_tone(tone)
+    idx = _CARD_IDX.get(id(card))
+    if idx is None:
+        return _join_blocks(prerender_blocks(card, orientation), tone, max_len)
+    orientation = "Reversed" if orientation.strip().lower().startswith("r") else "Upright"
+    return _render_cached(idx, orientation, tone, max_len)
 
 
 # ==============================
 # USER SETTINGS + HISTORY (DB-backed)
 # ==============================
 def get_user_settings(user_id: int) -> dict:
+    cached = _SETTINGS_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+
     with db_connect() as conn:
         with conn.cursor() as cur:
             cur.execute(
@@ -431,9 +554,12 @@ def get_user_settings(user_id: int) -> dict:
                 WHERE user_id=%s
                 """,
                 (user_id,),
+                prepare=True,
             )
             row = cur.fetchone()
-    return row or {"history_opt_in": False, "images_enabled": True}
+    settings = row or {"history_opt_in": False, "images_enabled": True}
+    _SETTINGS_CACHE[user_id] = settings
+    return settings
 
 
 def set_user_settings(
@@ -442,28 +568,32 @@ def set_user_settings(
     history_opt_in: Optional[bool] = None,
     images_enabled: Optional[bool] = None,
 ) -> dict:
-    current = get_user_settings(user_id)
-    if history_opt_in is None:
-        history_opt_in = current["history_opt_in"]
-    if images_enabled is None:
-        images_enabled = current["images_enabled"]
-
+    # None means "leave as is": COALESCE keeps the stored value (or the column
+    # default for a new row), so no read is needed before the write.
     with db_connect() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
                 INSERT INTO tarot_user_settings (user_id, history_opt_in, images_enabled)
-                VALUES (%s, %s, %s)
+                VALUES (
+                    %(user_id)s,
+                    COALESCE(%(history_opt_in)s::boolean, FALSE),
+                    COALESCE(%(images_enabled)s::boolean, TRUE)
+                )
                 ON CONFLICT (user_id) DO UPDATE SET
-                    history_opt_in = EXCLUDED.history_opt_in,
-                    images_enabled = EXCLUDED.images_enabled,
+                    history_opt_in = COALESCE(%(history_opt_in)s::boolean, tarot_user_settings.history_opt_in),
+                    images_enabled = COALESCE(%(images_enabled)s::boolean, tarot_user_settings.images_enabled),
                     updated_at = NOW()
+                RETURNING history_opt_in, images_enabled
                 """,
-                (user_id, history_opt_in, images_enabled),
+                {"user_id": user_id, "history_opt_in": history_opt_in, "images_enabled": images_enabled},
+                prepare=True,
             )
+            settings = cur.fetchone()
         conn.commit()
 
-    return {"history_opt_in": history_opt_in, "images_enabled": images_enabled}
+    _SETTINGS_CACHE[user_id] = settings
+    return settings
 
 def fetch_history(user_id: int, limit: int = 10) -> List[Dict[str, Any]]:
     with db_connect() as conn:
@@ -530,6 +660,19 @@ def summarize_history_row(command: str, payload: Dict[str, Any]) -> str:
         return "Saved reading."
 
 
+# History rows are queued by commands and written in batches by history_flusher
+HISTORY_BATCH_SIZE = 200
+HISTORY_FLUSH_INTERVAL = 2.0  # seconds to keep collecting after the first queued row
+_HISTORY_QUEUE: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=10_000)
+_HISTORY_FLUSHER: Optional[asyncio.Task] = None
+
+# /forgetme time per user: rows queued before it are dropped at write time, so a
+# batch already sitting in the queue (or in the flusher) can't resurrect history.
+# The lock keeps a COPY and the /forgetme DELETE from interleaving.
+_FORGOTTEN_AT = TTLDict(maxsize=10_000, ttl=600.0)
+_HISTORY_WRITE_LOCK = threading.Lock()
+
+
 def log_history_if_opted_in(
     user_id: int,
     command: str,
@@ -540,7 +683,8 @@ def log_history_if_opted_in(
 ) -> None:
     """
     If settings are provided, uses them (no extra DB read).
-    If not provided, fetches settings from DB.
+    If not provided, reads the (cached) settings.
+    Only queues the row; history_flusher does the INSERT.
     Never crashes a command if logging fails.
     """
     try:
@@ -550,52 +694,130 @@ def log_history_if_opted_in(
         if not settings.get("history_opt_in", False):
             return
 
+        _HISTORY_QUEUE.put_nowait((user_id, command, tone, payload, time.monotonic()))
+
+    except asyncio.QueueFull:
+        print(f"⚠️ history queue full; dropped /{command} entry")
+    except Exception as e:
+        print(f"⚠️ history log failed: {type(e).__name__}: {e}")
+
+
+def dump_json(obj: Any) -> str:
+    return orjson.dumps(obj).decode("utf-8") if ORJSON_OK else json.dumps(obj)
+
+
+def _insert_history_rows(rows: List[tuple]) -> None:
+    # Payloads are serialized here, off the event loop; COPY streams the whole
+    # batch in one statement and Postgres parses the JSON text into jsonb.
+    with _HISTORY_WRITE_LOCK:
+        rows = [
+            row for row in rows
+            if row[4] > _FORGOTTEN_AT.get(row[0], float("-inf"))
+        ]
+        if not rows:
+            return
         with db_connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO tarot_reading_history (user_id, command, tone, payload)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (user_id, command, tone, Json(payload)),
-                )
+                with cur.copy(
+                    "COPY tarot_reading_history (user_id, command, tone, payload) FROM STDIN"
+                ) as copy:
+                    for user_id, command, tone, payload, _queued_at in rows:
+                        copy.write_row((user_id, command, tone, dump_json(payload)))
             conn.commit()
 
+
+async def history_flusher() -> None:
+    """
+    Drain the history queue: one COPY per batch instead of one INSERT per
+    command. A batch closes at HISTORY_BATCH_SIZE rows or
+    HISTORY_FLUSH_INTERVAL seconds after its first row, whichever comes first.
+    """
+    loop = asyncio.get_running_loop()
+    rows: List[tuple] = []
+    try:
+        while True:
+            rows = [await _HISTORY_QUEUE.get()]
+            deadline = loop.time() + HISTORY_FLUSH_INTERVAL
+            while len(rows) < HISTORY_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(_HISTORY_QUEUE.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Once handed to the worker thread the batch is written even if we're cancelled
+            batch, rows = rows, []
+            try:
+                await asyncio.to_thread(_insert_history_rows, batch)
+            except Exception as e:
+                print(f"⚠️ history flush failed ({len(batch)} rows): {type(e).__name__}: {e}")
+    finally:
+        # Cancelled at shutdown while still collecting: these rows are already
+        # off the queue, so drain_history_queue would never see them
+        if rows:
+            try:
+                _insert_history_rows(rows)
+            except Exception as e:
+                print(f"⚠️ history flush failed ({len(rows)} rows): {type(e).__name__}: {e}")
+
+
+def drain_history_queue() -> None:
+    """
+    Write whatever is still queued. Called on shutdown, after the event loop
+    stops; the flusher writes its own in-flight batch when it is cancelled.
+    """
+    rows = []
+    while not _HISTORY_QUEUE.empty():
+        rows.append(_HISTORY_QUEUE.get_nowait())
+    if not rows:
+        return
+    try:
+        _insert_history_rows(rows)
     except Exception as e:
-        print(f"⚠️ history log failed: {type(e).__name__}: {e}")
+        print(f"⚠️ history drain failed ({len(rows)} rows): {type(e).__name__}: {e}")
 
 
 # ==============================
 # LOAD TAROT JSON
 # ==============================
 def load_tarot_json():
-    base_dir = Path(__file__).resolve().parent
-    json_path = base_dir / "Tarot_Official.JSON"
+    json_path = BASE_DIR / "Tarot_Official.JSON"
     if not json_path.exists():
         raise FileNotFoundError(
             f"❌ Tarot JSON not found at {json_path}. Make sure 'Tarot_Official.JSON' is in the same directory."
         )
-    with json_path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
-
-
-tarot_cards = load_tarot_json()
+    raw = json_path.read_bytes()
+    return orjson.loads(raw) if ORJSON_OK else json.loads(raw)
+
+
+# The deck is immutable; draws sample from it with a bot-local RNG so /shuffle
+# never reorders cards underneath a reading that's in flight.
+tarot_cards: Tuple[Dict[str, Any], ...] = tuple(load_tarot_json())
+_RNG = random.Random()
+_CARD_IDX: Dict[int, int] = {id(c): i for i, c in enumerate(tarot_cards)}
+PRERENDERED: List[Dict[str, Dict[str, str]]] = [
+    {o: prerender_blocks(c, o) for o in ("Upright", "Reversed")} for c in tarot_cards
+]
 print(f"✅ Loaded {len(tarot_cards)} tarot cards successfully!")
 
 # ==============================
 # AUTOCOMPLETE: CARD NAMES
 # ==============================
 CARD_NAMES: List[str] = sorted({c.get("name", "") for c in tarot_cards if c.get("name")})
+CARD_NAMES_LOWER: Tuple[Tuple[str, str], ...] = tuple((n.lower(), n) for n in CARD_NAMES)
 
-def _rank_card_matches(query: str, names: List[str], limit: int = 25) -> List[str]:
+
+# Autocomplete fires on nearly every keystroke and many users type the same prefixes
+@lru_cache(maxsize=1024)
+def _rank_card_matches(query: str, limit: int = 25) -> Tuple[str, ...]:
     q = (query or "").strip().lower()
     if not q:
-        return names[:limit]
+        return tuple(CARD_NAMES[:limit])
 
     starts = []
     contains = []
-    for n in names:
-        nl = n.lower()
+    for nl, n in CARD_NAMES_LOWER:
         if nl.startswith(q):
             starts.append(n)
         elif q in nl:
@@ -603,14 +825,14 @@ def _rank_card_matches(query: str, names: List[str], limit: int = 25) -> List[st
 
     # Startswith matches first, then contains matches
     results = starts + contains
-    return results[:limit]
+    return tuple(results[:limit])
 
 async def card_name_autocomplete(
     interaction: discord.Interaction,
     current: str,
 ) -> List[app_commands.Choice[str]]:
     try:
-        matches = _rank_card_matches(current, CARD_NAMES, limit=25)
+        matches = _rank_card_matches(current, limit=25)
         return [app_commands.Choice(name=m, value=m) for m in matches]
     except Exception as e:
         print(f"⚠️ autocomplete failed: {type(e).__name__}: {e}")
@@ -620,40 +842,176 @@ async def card_name_autocomplete(
 # ==============================
 # SEEKER MEMORY SYSTEM
 # ==============================
-BASE_DIR = Path(__file__).resolve().parent
-KNOWN_SEEKERS_FILE = BASE_DIR / "known_seekers.json"
+LEGACY_SEEKERS_FILE = BASE_DIR / "known_seekers.json"
 
+# Users known to have a tarot_seekers row, so returning seekers skip the DB
+_KNOWN_SEEKER_IDS: "set[int]" = set()
 
-def load_known_seekers() -> Dict[str, Any]:
-    if KNOWN_SEEKERS_FILE.exists():
-        try:
-            with KNOWN_SEEKERS_FILE.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"⚠️ could not load known_seekers: {type(e).__name__}: {e}")
-            return {}
-    return {}
 
+def remember_seeker(user_id: int, name: str) -> bool:
+    """Record a seeker. Returns True only the first time this user is ever seen."""
+    if user_id in _KNOWN_SEEKER_IDS:
+        return False
+
+    with db_connect() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO tarot_seekers (user_id, name)
+                VALUES (%s, %s)
+                ON CONFLICT (user_id) DO NOTHING
+                RETURNING user_id
+                """,
+                (user_id, name),
+                prepare=True,
+            )
+            first_time = cur.fetchone() is not None
+        conn.commit()
+
+    _KNOWN_SEEKER_IDS.add(user_id)
+    return first_time
 
-def save_known_seekers(data: Dict[str, Any]) -> None:
+
+def migrate_legacy_seekers() -> None:
+    """One-time import of the old known_seekers.json file into tarot_seekers."""
+    if not LEGACY_SEEKERS_FILE.exists():
+        return
     try:
-        with KNOWN_SEEKERS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with LEGACY_SEEKERS_FILE.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        rows = [
+            (int(uid), info.get("name") if isinstance(info, dict) else None)
+            for uid, info in data.items()
+        ]
+        with db_connect() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    """
+                    INSERT INTO tarot_seekers (user_id, name)
+                    VALUES (%s, %s)
+                    ON CONFLICT (user_id) DO NOTHING
+                    """,
+                    rows,
+                )
+            conn.commit()
+        LEGACY_SEEKERS_FILE.rename(BASE_DIR / "known_seekers.json.migrated")
+        print(f"✅ Migrated {len(rows)} known seekers into Postgres.")
     except Exception as e:
-        print(f"⚠️ could not save known_seekers: {type(e).__name__}: {e}")
+        print(f"⚠️ could not migrate known_seekers: {type(e).__name__}: {e}")
 
 
-known_seekers: Dict[str, Any] = load_known_seekers()
-user_intentions: Dict[int, str] = {}
+user_intentions = TTLDict(maxsize=50_000, ttl=86400.0)
+
+
+def _load_user_prefs(user_id: int) -> None:
+    """Prime both the tone and settings caches with a single round trip."""
+    with db_connect() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT p.tone, s.history_opt_in, s.images_enabled
+                FROM (SELECT %s::bigint AS user_id) AS u
+                LEFT JOIN tarot_user_prefs p ON p.user_id = u.user_id
+                LEFT JOIN tarot_user_settings s ON s.user_id = u.user_id
+                """,
+                (user_id,),
+                prepare=True,
+            )
+            row = cur.fetchone()
+    _TONE_CACHE[user_id] = normalize_tone(row["tone"]) if row["tone"] else DEFAULT_TONE
+    if row["history_opt_in"] is None:
+        _SETTINGS_CACHE[user_id] = {"history_opt_in": False, "images_enabled": True}
+    else:
+        _SETTINGS_CACHE[user_id] = {
+            "history_opt_in": row["history_opt_in"],
+            "images_enabled": row["images_enabled"],
+        }
+
+
+def _user_ctx(user_id: int) -> Tuple[str, Dict[str, Any], Optional[str]]:
+    """Everything a reading needs about the user in one call: (tone, settings, intention)."""
+    if _TONE_CACHE.get(user_id) is None and _SETTINGS_CACHE.get(user_id) is None:
+        _load_user_prefs(user_id)
+    return get_effective_tone(user_id), get_user_settings(user_id), user_intentions.get(user_id)
+
+
+# ==============================
+# RATE LIMITING
+# ==============================
+# Sliding 60s windows checked before any command body runs, so a flood from
+# one user (or one guild) is turned away before it reaches Postgres or disk.
+USER_RPM = int(os.getenv("ARCANARA_USER_RPM", "20"))
+GUILD_RPM = int(os.getenv("ARCANARA_GUILD_RPM", "120"))
+RATE_WINDOW = 60.0
+
+# Re-stored on every counted command, so an entry expires RATE_WINDOW after its
+# newest stamp (when it would be empty anyway); the size caps bound memory.
+_USER_WINDOW = TTLDict(maxsize=50_000, ttl=RATE_WINDOW)
+_GUILD_WINDOW = TTLDict(maxsize=10_000, ttl=RATE_WINDOW)
+
+
+def _window_retry_after(window: deque, limit: int, now: float) -> Optional[float]:
+    """Drop expired stamps; return seconds until a slot frees, or None if under the limit."""
+    while window and window[0] <= now - RATE_WINDOW:
+        window.popleft()
+    if len(window) >= limit:
+        return window[0] + RATE_WINDOW - now
+    return None
+
+
+def rate_limit_retry_after(user_id: int, guild_id: Optional[int]) -> Optional[float]:
+    now = time.monotonic()
+    user_window = _USER_WINDOW.get(user_id) or deque()
+    retry = _window_retry_after(user_window, USER_RPM, now)
+    guild_window = None
+    if guild_id is not None:
+        guild_window = _GUILD_WINDOW.get(guild_id) or deque()
+        if retry is None:
+            retry = _window_retry_after(guild_window, GUILD_RPM, now)
+    if retry is not None:
+        return retry
+
+    user_window.append(now)
+    _USER_WINDOW[user_id] = user_window
+    if guild_window is not None:
+        guild_window.append(now)
+        _GUILD_WINDOW[guild_id] = guild_window
+    return None
+
+
+class ArcanaraTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Autocomplete fires per keystroke; never count or block it
+        if interaction.type == discord.InteractionType.autocomplete:
+            return True
+
+        retry = rate_limit_retry_after(interaction.user.id, interaction.guild_id)
+        if retry is None:
+            return True
+
+        try:
+            await interaction.response.send_message(
+                f"{E['clock']} You’re drawing faster than the cards can settle. Try again in {retry:.0f}s.",
+                ephemeral=True,
+            )
+        except discord.HTTPException:
+            pass
+        return False
 
 
 # ==============================
 # BOT SETUP
 # ==============================
-intents = discord.Intents.default()
+# Slash commands only need guild events; skip member/message gateway traffic and caches
+intents = discord.Intents.none()
 intents.guilds = True
-intents.message_content = False
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = commands.Bot(
+    command_prefix="!",
+    intents=intents,
+    tree_cls=ArcanaraTree,
+    member_cache_flags=discord.MemberCacheFlags.none(),
+    chunk_guilds_at_startup=False,
+)
 
 
 # ==============================
@@ -678,6 +1036,42 @@ E = {
 }
 
 
+# ==============================
+# STATIC EMBED TEXT
+# ==============================
+TITLE_SHUFFLE = f"{E['shuffle']} Cleanse Complete {E['shuffle']}"
+TITLE_HISTORY = f"{E['book']} Your Recent Readings"
+TITLE_COTD = f"{E['crystal']} Card of the Day"
+TITLE_READ = f"{E['crystal']} Intuitive Reading {E['crystal']}"
+TITLE_THREECARD = f"{E['crystal']} Three-Card Spread"
+TITLE_CELTIC = f"{E['crystal']} Celtic Cross Spread {E['crystal']}"
+TITLE_CELTIC_CONTINUED = f"{E['crystal']} Celtic Cross (Continued {{part}}/{{total}})"
+TITLE_CLARIFY = f"{E['light']} Clarifier Card {E['light']}"
+TITLE_INSIGHT = f"{E['crystal']} Arcanara"
+
+FOOTER_HISTORY = "History is opt-in • Use /forgetme to delete stored data."
+FOOTER_READ = f"{E['spark']} Let these cards guide your awareness, not dictate your choices."
+FOOTER_INTERPRET = f"{E['light']} Interpreting symbols through Arcanara • Tarot Bot"
+FOOTER_CLARIFY = f"{E['spark']} A clarifier shines a smaller light within your larger spread."
+FOOTER_INSIGHT = "A tarot reading is a mirror, not a cage. You steer."
+
+# Spread positions: plain names (stored in history) and their display labels
+READ_POSITIONS = ("Situation", "Obstacle", "Guidance")
+READ_PRETTY = (f"Situation {E['sun']}", f"Obstacle {E['sword']}", f"Guidance {E['star']}")
+
+THREECARD_POSITIONS = ("Past", "Present", "Future")
+THREECARD_PRETTY = (f"Past {E['clock']}", f"Present {E['moon']}", f"Future {E['star']}")
+
+CELTIC_POSITIONS = (
+    "Present Situation", "Challenge", "Root Cause", "Past", "Conscious Goal",
+    "Near Future", "Self", "External Influence", "Hopes & Fears", "Outcome",
+)
+CELTIC_PRETTY = (
+    "1️⃣ Present Situation", "2️⃣ Challenge", "3️⃣ Root Cause", "4️⃣ Past", "5️⃣ Conscious Goal",
+    "6️⃣ Near Future", "7️⃣ Self", "8️⃣ External Influence", "9️⃣ Hopes & Fears", "🔟 Outcome",
+)
+
+
 # ==============================
 # NAME NORMALIZATION
 # ==============================
@@ -693,15 +1087,61 @@ NUM_WORDS = {
     "nine": "9",
     "ten": "10",
 }
-NUM_WORDS_RE = re.compile(r"\b(" + "|".join(NUM_WORDS.keys()) + r")\b")
+# Longest alternatives first so the regex engine never tries a shorter word
+# that can't complete at a word boundary
+NUM_WORDS_RE = re.compile(r"\b(" + "|".join(sorted(NUM_WORDS, key=len, reverse=True)) + r")\b")
+
+
+class _StripPunctuation(dict):
+    """str.translate table: keep a-z, 0-9 and whitespace, drop everything else."""
+
+    def __missing__(self, code: int) -> Optional[int]:
+        ch = chr(code)
+        keep = ("a" <= ch <= "z") or ("0" <= ch <= "9") or ch.isspace()
+        self[code] = code if keep else None
+        return self[code]
+
+
+_STRIP_PUNCT = _StripPunctuation()
 
 
 def normalize_card_name(name: str) -> str:
-    s = name.lower().strip()
+    s = name.lower()
     s = NUM_WORDS_RE.sub(lambda m: NUM_WORDS[m.group(1)], s)
-    s = re.sub(r"[^a-z0-9\s]", "", s)
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return " ".join(s.translate(_STRIP_PUNCT).split())
+
+
+# Card names never change after load, so normalize them once for /meaning
+_TAROT_INDEX: Tuple[Tuple[str, Dict[str, Any]], ...] = tuple(
+    (normalize_card_name(c.get("name", "")), c) for c in tarot_cards
+)
+_CARDS_BY_NORM: Dict[str, Dict[str, Any]] = {}
+_CARDS_BY_NAME: Dict[str, Dict[str, Any]] = {}
+for _norm, _card in _TAROT_INDEX:
+    _CARDS_BY_NORM.setdefault(_norm, _card)
+    _CARDS_BY_NAME.setdefault(_card.get("name"), _card)
+
+
+_NORM_NAMES_SORTED: List[str] = sorted(_CARDS_BY_NORM)
+
+
+@lru_cache(maxsize=2048)
+def find_card_by_query(query: str) -> Optional[Dict[str, Any]]:
+    """
+    Exact normalized match first, then the alphabetically first name starting
+    with the query, then the first card (deck order) whose name contains it.
+
+    Memoized: the deck is immutable, and /meaning mostly sees the same
+    autocompleted names over and over.
+    """
+    norm_query = normalize_card_name(query)
+    card = _CARDS_BY_NORM.get(norm_query)
+    if card is not None:
+        return card
+    i = bisect_left(_NORM_NAMES_SORTED, norm_query)
+    if i < len(_NORM_NAMES_SORTED) and _NORM_NAMES_SORTED[i].startswith(norm_query):
+        return _CARDS_BY_NORM[_NORM_NAMES_SORTED[i]]
+    return next((c for norm, c in _TAROT_INDEX if norm_query in norm), None)
 
 
 # ==============================
@@ -722,6 +1162,7 @@ def get_daily_card_row(user_id: int, day) -> Optional[Dict[str, Any]]:
                 WHERE user_id=%s AND day=%s
                 """,
                 (user_id, day),
+                prepare=True,
             )
             return cur.fetchone()
 
@@ -735,54 +1176,102 @@ def set_daily_card_row(user_id: int, day, card_name: str, orientation: str) -> N
                 ON CONFLICT (user_id, day) DO NOTHING
                 """,
                 (user_id, day, card_name, orientation),
+                prepare=True,
             )
         conn.commit()
 
 def find_card_by_name(name: str) -> Optional[Dict[str, Any]]:
-    return next((c for c in tarot_cards if c.get("name") == name), None)
+    return _CARDS_BY_NAME.get(name)
+
+def draw_orientation() -> str:
+    return "Reversed" if _RNG.getrandbits(1) else "Upright"
+
 
 def draw_card():
-    card = random.choice(tarot_cards)
-    orientation = random.choice(["Upright", "Reversed"])
-    return card, orientation
+    return _RNG.choice(tarot_cards), draw_orientation()
+
+
+ORIENTATIONS = ("Upright", "Reversed")
 
 
 def draw_unique_cards(num_cards: int):
-    deck = tarot_cards.copy()
-    random.shuffle(deck)
-    drawn = []
-    for _ in range(min(num_cards, len(deck))):
-        card = deck.pop()
-        orientation = random.choice(["Upright", "Reversed"])
-        drawn.append((card, orientation))
-    return drawn
+    cards = _RNG.sample(tarot_cards, min(num_cards, len(tarot_cards)))
+    # One RNG call for the whole spread; bit i decides card i's orientation
+    bits = _RNG.getrandbits(len(cards)) if cards else 0
+    return [(card, ORIENTATIONS[(bits >> i) & 1]) for i, card in enumerate(cards)]
 
 
-def clip_field(text: str, limit: int = 1024) -> str:
-    text = (text or "").strip()
-    if len(text) <= limit:
-        return text
-    return text[: limit - 1] + "…"
+def partition_fields(
+    fields: List[Tuple[str, str]],
+    *,
+    first_overhead: int,
+    cont_overhead: int,
+    limit: int = 5800,
+) -> List[List[Tuple[str, str]]]:
+    """
+    Split (name, value) embed fields into groups that each fit under Discord's
+    per-embed character budget, using prefix sums of the field lengths.
+    """
+    sizes = list(accumulate(len(n) + len(v) for n, v in fields))
+    groups: List[List[Tuple[str, str]]] = []
+    start, base, overhead = 0, 0, first_overhead
+    for i, total in enumerate(sizes):
+        if i > start and overhead + total - base > limit:
+            groups.append(fields[start:i])
+            start, base, overhead = i, sizes[i - 1], cont_overhead
+    groups.append(fields[start:])
+    return groups
+
+
+async def card_image_attachment(card_name: str, is_reversed: bool):
+    """make_image_attachment reads and re-encodes the image file; keep that off the event loop."""
+    return await asyncio.to_thread(make_image_attachment, card_name, is_reversed)
+
+
+def render_spread(
+    positions: Tuple[str, ...],
+    pretty_positions: Tuple[str, ...],
+    cards: List[tuple],
+    tone: str,
+) -> List[tuple]:
+    """Render each drawn card once: (position, pretty position, card, orientation, field text)."""
+    return [
+        (pos, pretty, card, orientation, render_card_text(card, orientation, tone, max_len=1000))
+        for pos, pretty, (card, orientation) in zip(positions, pretty_positions, cards)
+    ]
+
+
+def spread_history_cards(rendered: List[tuple]) -> List[Dict[str, str]]:
+    return [
+        {"position": pos, "name": card["name"], "orientation": orientation}
+        for pos, _pretty, card, orientation, _text in rendered
+    ]
+
+
+SUIT_COLORS = {
+    "Wands": 0xE25822,
+    "Cups": 0x0077BE,
+    "Swords": 0xB0B0B0,
+    "Pentacles": 0x2E8B57,
+    "Major Arcana": 0xA020F0,
+}
+DEFAULT_SUIT_COLOR = 0x9370DB
+
+SUIT_EMOJIS = {
+    "Wands": E["fire"],
+    "Cups": E["water"],
+    "Swords": E["sword"],
+    "Pentacles": E["leaf"],
+    "Major Arcana": E["arcana"],
+}
 
 
 def suit_color(suit):
-    return {
-        "Wands": 0xE25822,
-        "Cups": 0x0077BE,
-        "Swords": 0xB0B0B0,
-        "Pentacles": 0x2E8B57,
-        "Major Arcana": 0xA020F0,
-    }.get(suit, 0x9370DB)
+    return SUIT_COLORS.get(suit, DEFAULT_SUIT_COLOR)
 
 
 def suit_emoji(suit):
-    return {
-        "Wands": E["fire"],
-        "Cups": E["water"],
-        "Swords": E["sword"],
-        "Pentacles": E["leaf"],
-        "Major Arcana": E["arcana"],
-    }.get(suit, E["crystal"])
+    return SUIT_EMOJIS.get(suit, E["crystal"])
 
 
 def _chunk_lines(lines: List[str], max_len: int = 950) -> List[str]:
@@ -876,42 +1365,47 @@ def _chunk_text(text: str, max_len: int = 1900) -> List[str]:
     return [p for p in parts if p.strip()]
 
 
+# Everything after the guild-specific opening line is static, so it's built once
+ONBOARDING_BODY = (
+    "I don’t read messages. I don’t rummage through DMs.\n"
+    "I *do* translate symbols into clean choices — with a little shimmer on the edges.\n\n"
+
+    "🧭 **Quick Setup**\n"
+    "1) **/tone** — choose how I speak (full, direct, poetic, shadow, love, work, money)\n"
+    "2) **/intent** — set your intention (your focus / question)\n"
+    "3) **/settings** — images on/off + history opt-in (off by default)\n"
+    "4) **/shuffle** — reset intention + tone (fresh slate)\n\n"
+
+    "✨ **Start Here**\n"
+    "• **/cardoftheday** — one clear message for today\n"
+    "• **/read** — Situation • Obstacle • Guidance (you provide an intention)\n"
+    "• **/threecard** — Past • Present • Future\n"
+    "• **/celtic** — full 10-card Celtic Cross\n"
+    "• **/clarify** — one extra card for your current intention\n"
+    "• **/meaning** — look up any card (upright + reversed)\n"
+    "• **/history** — reflect on past readings\n"
+    "• **/mystery** → **/reveal** — dramatic pause included\n\n"
+
+    "🔒 **Privacy**\n"
+    "History is **opt-in** only. Use **/forgetme** to delete stored data.\n\n"
+
+    "🛡️ **Permissions (so I can speak)**\n"
+    "• **Send Messages** (required)\n"
+    "• **Attach Files** (recommended for card images)\n"
+    "• **Embed Links** (optional)\n\n"
+
+    "Need the full guided help at any time? Use **/insight**.\n"
+    "Admins: **/resendwelcome** re-sends this welcome."
+)
+
+
 def build_onboarding_messages(guild: discord.Guild) -> List[str]:
     # One message, Chronobot-style. Keep it under 2000 chars.
     msg = (
         f"🔮 **Arcanara has crossed the threshold**\n"
         f"I’ve anchored to **{guild.name}**.\n"
-        "I don’t read messages. I don’t rummage through DMs.\n"
-        "I *do* translate symbols into clean choices — with a little shimmer on the edges.\n\n"
-
-        "🧭 **Quick Setup**\n"
-        "1) **/tone** — choose how I speak (full, direct, poetic, shadow, love, work, money)\n"
-        "2) **/intent** — set your intention (your focus / question)\n"
-        "3) **/settings** — images on/off + history opt-in (off by default)\n"
-        "4) **/shuffle** — reset intention + tone (fresh slate)\n\n"
-
-        "✨ **Start Here**\n"
-        "• **/cardoftheday** — one clear message for today\n"
-        "• **/read** — Situation • Obstacle • Guidance (you provide an intention)\n"
-        "• **/threecard** — Past • Present • Future\n"
-        "• **/celtic** — full 10-card Celtic Cross\n"
-        "• **/clarify** — one extra card for your current intention\n"
-        "• **/meaning** — look up any card (upright + reversed)\n"
-        "• **/history** — reflect on past readings\n"
-        "• **/mystery** → **/reveal** — dramatic pause included\n\n"
-
-        "🔒 **Privacy**\n"
-        "History is **opt-in** only. Use **/forgetme** to delete stored data.\n\n"
-
-        "🛡️ **Permissions (so I can speak)**\n"
-        "• **Send Messages** (required)\n"
-        "• **Attach Files** (recommended for card images)\n"
-        "• **Embed Links** (optional)\n\n"
-
-        "Need the full guided help at any time? Use **/insight**.\n"
-        "Admins: **/resendwelcome** re-sends this welcome."
+        + ONBOARDING_BODY
     )
-
     return [msg]
 
 
@@ -934,7 +1428,13 @@ async def send_onboarding_message(guild: discord.Guild):
     # 1) Prefer inviter (audit log), else owner
     recipient = await find_bot_inviter(guild, bot.user)
     if recipient is None:
+        # Members aren't cached, so the owner usually has to be fetched
         recipient = guild.owner
+        if recipient is None and guild.owner_id:
+            try:
+                recipient = await guild.fetch_member(guild.owner_id)
+            except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+                recipient = None
 
     # Try DM recipient
     if recipient:
@@ -978,39 +1478,41 @@ async def on_guild_join(guild: discord.Guild):
 # IN-CHARACTER RESPONSES
 # ==============================
 in_character_lines = {
-    "shuffle": [
+    "shuffle": (
         "The deck hums with fresh energy once more.",
         "All is reset. The cards breathe again.",
         "Order dissolves into possibility — the deck is ready.",
-    ],
-    "daily": [
+    ),
+    "daily": (
         "Here is the energy that threads through your day...",
         "This card has stepped forward to guide you.",
         "Its message hums softly — take it with you into the light.",
-    ],
-    "spread": [
+    ),
+    "spread": (
         "The weave of time unfolds — past, present, and future speak.",
         "Let us see how the threads intertwine for your path.",
         "Each card now reveals its whisper in the larger story.",
-    ],
-    "deep": [
+    ),
+    "deep": (
         "This spread carries depth — breathe as you read its symbols.",
         "A more ancient current flows beneath these cards.",
         "The deck speaks slowly now; listen beyond the words.",
-    ],
-    "general": [
+    ),
+    "general": (
         "The veil lifts and a message takes shape...",
         "Listen closely — the cards are patient but precise.",
         "A single spark of insight is about to emerge...",
-    ],
+    ),
 }
+_IC_GENERAL = in_character_lines["general"]
 
 
 # ==============================
 # EPHEMERAL SENDER (in-character, attachment-safe, ack-safe)
 # ==============================
 def _prepend_in_character(embed: discord.Embed, mood: str) -> discord.Embed:
-    line = random.choice(in_character_lines.get(mood, in_character_lines["general"]))
+    lines = in_character_lines.get(mood) or _IC_GENERAL
+    line = lines[_RNG.randrange(len(lines))]
     if embed.description:
         embed.description = f"*{line}*\n\n{embed.description}"
     else:
@@ -1058,43 +1560,61 @@ async def send_ephemeral(
         return
 
     except discord.HTTPException as e:
-        # If Discord says “already acknowledged”, fall back to followup
+        # send_fn is chosen from is_done(), so 40060 ("already acknowledged")
+        # only happens on a race; log it and let the tree error handler report it
         if getattr(e, "code", None) == 40060:
-            try:
-                if embed is not None:
-                    embed = _prepend_in_character(embed, mood)
-                    await interaction.followup.send(**_send_kwargs(content=content, embed=embed, ephemeral=True))
-                    return
-                if embeds:
-                    embeds = list(embeds)
-                    embeds[0] = _prepend_in_character(embeds[0], mood)
-                    await interaction.followup.send(**_send_kwargs(content=content, embeds=embeds, ephemeral=True))
-                    return
-                await interaction.followup.send(**_send_kwargs(content=content or "—", ephemeral=True))
-                return
-            except Exception:
-                pass
+            print("⚠️ send_ephemeral: interaction was already acknowledged (40060)")
         raise
 
 
+# Users with a spread currently being drawn; a second spread is refused until the first finishes
+_READINGS_IN_FLIGHT: "set[int]" = set()
+
+
+def one_reading_at_a_time(func):
+    """Reject a spread command while the same user already has one in progress."""
+    @wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        uid = interaction.user.id
+        if uid in _READINGS_IN_FLIGHT:
+            if await safe_defer(interaction, ephemeral=True):
+                await send_ephemeral(
+                    interaction,
+                    content=f"{E['clock']} You already have a reading in progress. Let it finish first.",
+                    mood="general",
+                )
+            return
+        _READINGS_IN_FLIGHT.add(uid)
+        try:
+            return await func(interaction, *args, **kwargs)
+        finally:
+            _READINGS_IN_FLIGHT.discard(uid)
+    return wrapper
+
+
 # ==============================
 # EVENTS
 # ==============================
 @bot.event
 async def on_ready():
-    global _DB_READY
+    global _DB_READY, _HISTORY_FLUSHER
     if not _DB_READY:
         try:
             ensure_tables()
+            migrate_legacy_seekers()
             _DB_READY = True
             print("✅ DB ready.")
         except Exception as e:
             print(f"❌ DB init failed: {type(e).__name__}: {e}")
             return
 
+    if _HISTORY_FLUSHER is None or _HISTORY_FLUSHER.done():
+        _HISTORY_FLUSHER = asyncio.create_task(history_flusher())
+
     try:
         await bot.tree.sync()
         print("✅ Slash commands synced.")
+        _insight_chunks()
     except Exception as e:
         print(f"⚠️ Slash sync failed: {type(e).__name__}: {e}")
 
@@ -1107,6 +1627,18 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
     if interaction.type == discord.InteractionType.autocomplete:
         return
 
+    # Cooldowns are expected traffic, not failures: tell the user when to retry
+    if isinstance(error, app_commands.CommandOnCooldown):
+        try:
+            await send_ephemeral(
+                interaction,
+                content=f"{E['clock']} The cards are still settling. Try again in {error.retry_after:.0f}s.",
+                mood="general",
+            )
+        except Exception as e:
+            print(f"⚠️ Failed to send cooldown message: {type(e).__name__}: {e}")
+        return
+
     orig = getattr(error, "original", error)
     print(f"⚠️ Slash command error: {type(error).__name__}: {error}")
     print(f"⚠️ Original: {type(orig).__name__}: {orig}")
@@ -1134,10 +1666,10 @@ async def shuffle_slash(interaction: discord.Interaction):
     user_intentions.pop(interaction.user.id, None)
     MYSTERY_STATE.pop(interaction.user.id, None)
     reset_user_tone(interaction.user.id)  # resets stored tone/mode to default
-    random.shuffle(tarot_cards)
+    _RNG.seed()  # fresh entropy; the deck itself is never reordered
 
     embed = discord.Embed(
-        title=f"{E['shuffle']} Cleanse Complete {E['shuffle']}",
+        title=TITLE_SHUFFLE,
         description=(
             "The deck is cleared.\n\n"
             f"• **Intention**: reset\n"
@@ -1197,11 +1729,11 @@ async def history_slash(interaction: discord.Interaction, limit: Optional[int] =
     text = _clip("\n".join(lines), max_len=3800)
 
     embed = discord.Embed(
-        title=f"{E['book']} Your Recent Readings",
+        title=TITLE_HISTORY,
         description=text,
         color=0x6A5ACD,
     )
-    embed.set_footer(text="History is opt-in • Use /forgetme to delete stored data.")
+    embed.set_footer(text=FOOTER_HISTORY)
 
     await send_ephemeral(interaction, embed=embed, mood="general")
 
@@ -1224,17 +1756,15 @@ async def cardoftheday_slash(interaction: discord.Interaction):
         card, orientation = draw_card()
         set_daily_card_row(interaction.user.id, day, card["name"], orientation)
 
-    tone = get_effective_tone(interaction.user.id)
+    tone, settings, intent_text = _user_ctx(interaction.user.id)
     meaning = render_card_text(card, orientation, tone)
 
-    settings = get_user_settings(interaction.user.id)
-
     is_reversed = (orientation == "Reversed")
     file_obj, attach_url = None, None
 
     if settings.get("images_enabled", True):
         try:
-            file_obj, attach_url = make_image_attachment(card["name"], is_reversed)
+            file_obj, attach_url = await card_image_attachment(card["name"], is_reversed)
             if not attach_url and file_obj is not None:
                 attach_url = f"attachment://{file_obj.filename}"
         except Exception as e:
@@ -1242,11 +1772,9 @@ async def cardoftheday_slash(interaction: discord.Interaction):
             file_obj, attach_url = None, None
 
     tone_emoji = E["sun"] if orientation == "Upright" else E["moon"]
-    intent_text = user_intentions.get(interaction.user.id)
 
-    desc = f"**{card['name']} ({orientation} {tone_emoji}) • {tone_label(tone)}**\n\n{meaning}"
-    if intent_text:
-        desc += f"\n\n{E['light']} **Intention:** *{intent_text}*"
+    intent_line = f"\n\n{E['light']} **Intention:** *{intent_text}*" if intent_text else ""
+    desc = f"**{card['name']} ({orientation} {tone_emoji}) • {tone_label(tone)}**\n\n{meaning}{intent_line}"
 
     log_history_if_opted_in(
         interaction.user.id,
@@ -1263,7 +1791,7 @@ async def cardoftheday_slash(interaction: discord.Interaction):
     )
 
     embed = discord.Embed(
-        title=f"{E['crystal']} Card of the Day",
+        title=TITLE_COTD,
         description=desc,
         color=suit_color(card["suit"]),
     )
@@ -1276,15 +1804,16 @@ async def cardoftheday_slash(interaction: discord.Interaction):
 
 @bot.tree.command(name="read", description="Three-card reading: Situation • Obstacle • Guidance.")
 @app_commands.describe(intention="Your question or intention (example: my career path)")
+@one_reading_at_a_time
 async def read_slash(interaction: discord.Interaction, intention: str):
     if not await safe_defer(interaction, ephemeral=True):
         return
 
     user_intentions[interaction.user.id] = intention
-    tone = get_effective_tone(interaction.user.id)
+    tone, settings, _intent = _user_ctx(interaction.user.id)
 
     cards = draw_unique_cards(3)
-    positions = ["Situation", "Obstacle", "Guidance"]
+    rendered = render_spread(READ_POSITIONS, READ_PRETTY, cards, tone)
 
     log_history_if_opted_in(
         interaction.user.id,
@@ -1293,42 +1822,33 @@ async def read_slash(interaction: discord.Interaction, intention: str):
         payload={
             "intention": intention,
             "spread": "situation_obstacle_guidance",
-            "cards": [
-                {"position": pos, "name": card["name"], "orientation": orientation}
-                for pos, (card, orientation) in zip(positions, cards)
-            ],
+            "cards": spread_history_cards(rendered),
         },
+        settings=settings,
     )
 
     embed = discord.Embed(
-        title=f"{E['crystal']} Intuitive Reading {E['crystal']}",
+        title=TITLE_READ,
         description=f"{E['light']} **Intention:** *{intention}*\n\n**How I’ll read this:** {tone_label(tone)}",
         color=0x9370DB,
     )
 
-    pretty_positions = [f"Situation {E['sun']}", f"Obstacle {E['sword']}", f"Guidance {E['star']}"]
-    for pos, (card, orientation) in zip(pretty_positions, cards):
-        meaning = render_card_text(card, orientation, tone)
-        embed.add_field(
-            name=f"{pos}: {card['name']} ({orientation})",
-            value=meaning if len(meaning) < 1000 else meaning[:997] + "...",
-            inline=False,
-        )
+    for _pos, pretty, card, orientation, text in rendered:
+        embed.add_field(name=f"{pretty}: {card['name']} ({orientation})", value=text, inline=False)
 
-    embed.set_footer(text=f"{E['spark']} Let these cards guide your awareness, not dictate your choices.")
+    embed.set_footer(text=FOOTER_READ)
     await send_ephemeral(interaction, embed=embed, mood="spread")
 
 
 @bot.tree.command(name="threecard", description="Past • Present • Future spread.")
+@one_reading_at_a_time
 async def threecard_slash(interaction: discord.Interaction):
     if not await safe_defer(interaction, ephemeral=True):
         return
 
-    positions = ["Past", "Present", "Future"]
     cards = draw_unique_cards(3)
-
-    tone = get_effective_tone(interaction.user.id)
-    intent_text = user_intentions.get(interaction.user.id)
+    tone, settings, intent_text = _user_ctx(interaction.user.id)
+    rendered = render_spread(THREECARD_POSITIONS, THREECARD_PRETTY, cards, tone)
 
     log_history_if_opted_in(
         interaction.user.id,
@@ -1337,47 +1857,35 @@ async def threecard_slash(interaction: discord.Interaction):
         payload={
             "intention": intent_text,
             "spread": "past_present_future",
-            "cards": [
-                {"position": pos, "name": card["name"], "orientation": orientation}
-                for pos, (card, orientation) in zip(positions, cards)
-            ],
+            "cards": spread_history_cards(rendered),
         },
+        settings=settings,
     )
 
-    desc = "Past • Present • Future"
-    if intent_text:
-        desc += f"\n\n{E['light']} **Intention:** *{intent_text}*"
-    desc += f"\n\n**How I’ll read this:** {tone_label(tone)}"
+    intent_line = f"\n\n{E['light']} **Intention:** *{intent_text}*" if intent_text else ""
+    desc = f"Past • Present • Future{intent_line}\n\n**How I’ll read this:** {tone_label(tone)}"
 
     embed = discord.Embed(
-        title=f"{E['crystal']} Three-Card Spread",
+        title=TITLE_THREECARD,
         description=desc,
         color=0xA020F0,
     )
 
-    pretty_positions = [f"Past {E['clock']}", f"Present {E['moon']}", f"Future {E['star']}"]
-    for pos, (card, orientation) in zip(pretty_positions, cards):
-        meaning = render_card_text(card, orientation, tone)
-        embed.add_field(
-            name=f"{pos}: {card['name']} ({orientation})",
-            value=meaning if len(meaning) < 1000 else meaning[:997] + "...",
-            inline=False,
-        )
+    for _pos, pretty, card, orientation, text in rendered:
+        embed.add_field(name=f"{pretty}: {card['name']} ({orientation})", value=text, inline=False)
 
     await send_ephemeral(interaction, embed=embed, mood="spread")
 
 @bot.tree.command(name="celtic", description="Full 10-card Celtic Cross spread.")
 @app_commands.checks.cooldown(1, 120.0)
+@one_reading_at_a_time
 async def celtic_slash(interaction: discord.Interaction):
     if not await safe_defer(interaction, ephemeral=True):
         return
 
-    positions = [
-        "Present Situation", "Challenge", "Root Cause", "Past", "Conscious Goal",
-        "Near Future", "Self", "External Influence", "Hopes & Fears", "Outcome",
-    ]
     cards = draw_unique_cards(10)
-    tone = get_effective_tone(interaction.user.id)
+    tone, settings, _intent = _user_ctx(interaction.user.id)
+    rendered = render_spread(CELTIC_POSITIONS, CELTIC_PRETTY, cards, tone)
 
     log_history_if_opted_in(
         interaction.user.id,
@@ -1385,52 +1893,48 @@ async def celtic_slash(interaction: discord.Interaction):
         tone=tone,
         payload={
             "spread": "celtic_cross",
-            "cards": [
-                {"position": pos, "name": card["name"], "orientation": orientation}
-                for pos, (card, orientation) in zip(positions, cards)
-            ],
+            "cards": spread_history_cards(rendered),
         },
+        settings=settings,
     )
 
-    embeds_to_send: List[discord.Embed] = []
-    embed = discord.Embed(
-        title=f"{E['crystal']} Celtic Cross Spread {E['crystal']}",
-        description=f"A deep, archetypal exploration of your path.\n\n**How I’ll read this:** {tone_label(tone)}",
-        color=0xA020F0,
-    )
-    total_length = len(embed.title) + len(embed.description)
-
-    pretty_positions = [
-        "1️⃣ Present Situation", "2️⃣ Challenge", "3️⃣ Root Cause", "4️⃣ Past", "5️⃣ Conscious Goal",
-        "6️⃣ Near Future", "7️⃣ Self", "8️⃣ External Influence", "9️⃣ Hopes & Fears", "🔟 Outcome",
+    fields = [
+        (f"{pretty}: {card['name']} ({orientation})", field_value)
+        for _pos, pretty, card, orientation, field_value in rendered
     ]
+    first_desc = f"A deep, archetypal exploration of your path.\n\n**How I’ll read this:** {tone_label(tone)}"
+    cont_desc = f"**How I’ll read this:** {tone_label(tone)}"
+    # Continuations are numbered so they read correctly even if they land out of
+    # order; budget for the longest number that title could carry
+    longest_cont_title = TITLE_CELTIC_CONTINUED.format(part=len(fields), total=len(fields))
+    groups = partition_fields(
+        fields,
+        first_overhead=len(TITLE_CELTIC) + len(first_desc),
+        cont_overhead=len(longest_cont_title) + len(cont_desc),
+    )
 
-    for pos, (card, orientation) in zip(pretty_positions, cards):
-        meaning = render_card_text(card, orientation, tone)
-        field_name = f"{pos}: {card['name']} ({orientation})"
-        field_value = meaning if len(meaning) < 1000 else meaning[:997] + "..."
-        field_length = len(field_name) + len(field_value)
-
-        if total_length + field_length > 5800:
-            embeds_to_send.append(embed)
-            embed = discord.Embed(
-                title=f"{E['crystal']} Celtic Cross (Continued)",
-                description=f"**How I’ll read this:** {tone_label(tone)}",
-                color=0xA020F0,
-            )
-            total_length = len(embed.title) + len(embed.description)
-
-        embed.add_field(name=field_name, value=field_value, inline=False)
-        total_length += field_length
-
-    embeds_to_send.append(embed)
+    embeds_to_send: List[discord.Embed] = []
+    for i, group in enumerate(groups):
+        embed = discord.Embed(
+            title=TITLE_CELTIC if i == 0 else TITLE_CELTIC_CONTINUED.format(part=i + 1, total=len(groups)),
+            description=first_desc if i == 0 else cont_desc,
+            color=0xA020F0,
+        )
+        for field_name, field_value in group:
+            embed.add_field(name=field_name, value=field_value, inline=False)
+        embeds_to_send.append(embed)
 
     # First embed via send_ephemeral
     await send_ephemeral(interaction, embed=embeds_to_send[0], mood="deep")
 
-    # Remaining embeds must be followups (interaction already acknowledged)
-    for e in embeds_to_send[1:]:
-        await interaction.followup.send(embeds=[e], ephemeral=True)
+    # Remaining embeds must be followups (interaction already acknowledged); send them concurrently
+    results = await asyncio.gather(
+        *(interaction.followup.send(embeds=[e], ephemeral=True) for e in embeds_to_send[1:]),
+        return_exceptions=True,
+    )
+    for res in results:
+        if isinstance(res, Exception):
+            print(f"⚠️ Celtic followup failed: {type(res).__name__}: {res}")
 
 @bot.tree.command(name="tone", description="Choose Arcanara’s reading tone (your default lens).")
 @app_commands.choices(
@@ -1506,15 +2010,8 @@ async def meaning_slash(interaction: discord.Interaction, card: str):
     if not await safe_defer(interaction, ephemeral=True):
         return
 
-    norm_query = normalize_card_name(card)
-
-    matches = [
-        c for c in tarot_cards
-        if normalize_card_name(c.get("name", "")) == norm_query
-        or norm_query in normalize_card_name(c.get("name", ""))
-    ]
-
-    if not matches:
+    chosen = find_card_by_query(card)
+    if chosen is None:
         await send_ephemeral(
             interaction,
             content=f"{E['warn']} I searched the deck but found no card named **{card}**.",
@@ -1522,11 +2019,9 @@ async def meaning_slash(interaction: discord.Interaction, card: str):
         )
         return
 
-    chosen = matches[0]
     chosen_name = chosen.get("name", "").strip()
 
-    tone = get_effective_tone(interaction.user.id)
-    settings = get_user_settings(interaction.user.id)
+    tone, settings, _intent = _user_ctx(interaction.user.id)
 
     suit = chosen.get("suit") or "Major Arcana"
     color = suit_color(suit)
@@ -1547,15 +2042,17 @@ async def meaning_slash(interaction: discord.Interaction, card: str):
         color=color,
     )
 
-    upright_text = clip_field(render_card_text(chosen, "Upright", tone), 1024)
-    reversed_text = clip_field(render_card_text(chosen, "Reversed", tone), 1024)
+    upright_text = render_card_text(chosen, "Upright", tone, max_len=1024)
+    reversed_text = render_card_text(chosen, "Reversed", tone, max_len=1024)
 
     embed.add_field(name=f"Upright {E['sun']} • {tone}", value=upright_text or "—", inline=False)
     embed.add_field(name=f"Reversed {E['moon']} • {tone}", value=reversed_text or "—", inline=False)
-    embed.set_footer(text=f"{E['light']} Interpreting symbols through Arcanara • Tarot Bot")
+    embed.set_footer(text=FOOTER_INTERPRET)
 
-    # --- Image: same attachment style as cardoftheday ---
-    file_obj, attach_url = make_image_attachment(chosen_name, False)
+    # --- Image: same attachment style as cardoftheday (skipped entirely when images are off) ---
+    file_obj = None
+    if settings.get("images_enabled", True):
+        file_obj, _attach_url = await card_image_attachment(chosen_name, False)
 
     if file_obj:
         embed.set_image(url=f"attachment://{file_obj.filename}")
@@ -1572,9 +2069,7 @@ async def clarify_slash(interaction: discord.Interaction):
 
     card, orientation = draw_card()
     tone_emoji = E["sun"] if orientation == "Upright" else E["moon"]
-    intent_text = user_intentions.get(interaction.user.id)
-
-    tone = get_effective_tone(interaction.user.id)
+    tone, settings, intent_text = _user_ctx(interaction.user.id)
     meaning = render_card_text(card, orientation, tone)
 
     log_history_if_opted_in(
@@ -1585,18 +2080,18 @@ async def clarify_slash(interaction: discord.Interaction):
             "intention": intent_text,
             "card": {"name": card["name"], "orientation": orientation},
         },
+        settings=settings,
     )
 
-    desc = f"**{card['name']} ({orientation} {tone_emoji}) • {tone_label(tone)}**\n\n{meaning}"
-    if intent_text:
-        desc += f"\n\n{E['light']} **Clarifying Intention:** *{intent_text}*"
+    intent_line = f"\n\n{E['light']} **Clarifying Intention:** *{intent_text}*" if intent_text else ""
+    desc = f"**{card['name']} ({orientation} {tone_emoji}) • {tone_label(tone)}**\n\n{meaning}{intent_line}"
 
     embed = discord.Embed(
-        title=f"{E['light']} Clarifier Card {E['light']}",
+        title=TITLE_CLARIFY,
         description=desc,
         color=suit_color(card["suit"]),
     )
-    embed.set_footer(text=f"{E['spark']} A clarifier shines a smaller light within your larger spread.")
+    embed.set_footer(text=FOOTER_CLARIFY)
     await send_ephemeral(interaction, embed=embed, mood="general")
 
 @bot.tree.command(name="intent", description="Set (or view) your current intention.")
@@ -1621,13 +2116,12 @@ async def mystery_slash(interaction: discord.Interaction):
     if not await safe_defer(interaction, ephemeral=True):
         return
 
-    card = random.choice(tarot_cards)
-    is_reversed = random.random() < 0.5
+    card = _RNG.choice(tarot_cards)
+    is_reversed = bool(_RNG.getrandbits(1))
 
     MYSTERY_STATE[interaction.user.id] = {
-        "name": card["name"],
+        "card": card,
         "is_reversed": is_reversed,
-        "ts": time.time(),
     }
 
     settings = get_user_settings(interaction.user.id)
@@ -1642,7 +2136,7 @@ async def mystery_slash(interaction: discord.Interaction):
 
     if settings.get("images_enabled", True):
         try:
-            file_obj, attach_url = make_image_attachment(card["name"], is_reversed)
+            file_obj, attach_url = await card_image_attachment(card["name"], is_reversed)
 
             # If make_image_attachment returns a File but no URL, use attachment://
             if not attach_url and file_obj is not None:
@@ -1691,23 +2185,13 @@ async def reveal_slash(interaction: discord.Interaction):
         return
 
     try:
-        name = state["name"]
+        card = state["card"]
         is_reversed = state["is_reversed"]
 
-        card = next((c for c in tarot_cards if c["name"] == name), None)
-        if not card:
-            await send_ephemeral(
-                interaction,
-                content=f"{E['warn']} I lost track of that card. Try **/mystery** again.",
-                mood="general",
-            )
-            return
-
-        tone = get_effective_tone(interaction.user.id)
+        tone, settings, _intent = _user_ctx(interaction.user.id)
         orientation = "Reversed" if is_reversed else "Upright"
         meaning = render_card_text(card, orientation, tone)
 
-        settings = get_user_settings(interaction.user.id)
         log_history_if_opted_in(
             interaction.user.id,
             command="reveal",
@@ -1724,7 +2208,7 @@ async def reveal_slash(interaction: discord.Interaction):
             description=meaning,
             color=suit_color(card["suit"]),
         )
-        embed.set_footer(text=f"{E['light']} Interpreting symbols through Arcanara • Tarot Bot")
+        embed.set_footer(text=FOOTER_INTERPRET)
 
         await send_ephemeral(interaction, embed=embed, mood="general")
 
@@ -1732,20 +2216,32 @@ async def reveal_slash(interaction: discord.Interaction):
         MYSTERY_STATE.pop(interaction.user.id, None)
 
 
+def build_command_index_chunks() -> List[str]:
+    cmds = sorted(
+        (c for c in bot.tree.get_commands() if isinstance(c, app_commands.Command)),
+        key=lambda c: c.name,
+    )
+    lines = []
+    for c in cmds:
+        desc = (c.description or "").strip()
+        lines.append(f"• `/{c.name}` — {desc}" if desc else f"• `/{c.name}`")
+    return _chunk_lines(lines, max_len=900)
+
+
+@lru_cache(maxsize=1)
+def _insight_chunks() -> Tuple[str, ...]:
+    # The command tree is fixed once the module has loaded, so the /insight listing is built once
+    return tuple(build_command_index_chunks())
+
+
 @bot.tree.command(name="insight", description="A guided intro to Arcanara (and a full list of commands).")
 async def insight_slash(interaction: discord.Interaction):
     if not await safe_defer(interaction, ephemeral=True):
         return
-    user_id_str = str(interaction.user.id)
     user_name = interaction.user.display_name
+    first_time = remember_seeker(interaction.user.id, user_name)
 
-    first_time = user_id_str not in known_seekers
-    if first_time:
-        known_seekers[user_id_str] = {"name": user_name}
-        save_known_seekers(known_seekers)
-
-    current_tone = get_effective_tone(interaction.user.id)
-    current_intent = user_intentions.get(interaction.user.id, None)
+    current_tone, _settings, current_intent = _user_ctx(interaction.user.id)
 
     greetings_first = [
         f"Come closer, {user_name} — let’s see what wants to be known.",
@@ -1779,30 +2275,10 @@ async def insight_slash(interaction: discord.Interaction):
         "If you want to wipe the slate clean: **/shuffle** resets intention + tone."
     )
 
-    cmds = [c for c in bot.tree.get_commands() if isinstance(c, app_commands.Command)]
-    cmds = sorted(cmds, key=lambda c: c.name)
-
-    lines = []
-    for c in cmds:
-        desc = (c.description or "").strip()
-        lines.append(f"• `/{c.name}` — {desc}" if desc else f"• `/{c.name}`")
-
-    chunks: List[str] = []
-    buf: List[str] = []
-    size = 0
-    for line in lines:
-        if size + len(line) + 1 > 900:
-            chunks.append("\n".join(buf))
-            buf = [line]
-            size = len(line) + 1
-        else:
-            buf.append(line)
-            size += len(line) + 1
-    if buf:
-        chunks.append("\n".join(buf))
+    chunks = _insight_chunks()
 
     embed = discord.Embed(
-        title=f"{E['crystal']} Arcanara",
+        title=TITLE_INSIGHT,
         description=f"*{opener}*\n\n{guided}",
         color=0xB28DFF,
     )
@@ -1811,25 +2287,57 @@ async def insight_slash(interaction: discord.Interaction):
     for i, part in enumerate(chunks[1:], start=2):
         embed.add_field(name=f"What I can do for you (cont. {i})", value=part, inline=False)
 
-    embed.set_footer(text="A tarot reading is a mirror, not a cage. You steer.")
+    embed.set_footer(text=FOOTER_INSIGHT)
     await send_ephemeral(interaction, embed=embed, mood="general")
 
 
+# Static, so build it once; send copies in case anything downstream mutates it
+PRIVACY_EMBED = discord.Embed(
+    title="🔒 Arcanara Privacy",
+    description=(
+        "**Stored data (optional / minimal):**\n"
+        "• Your chosen `/tone`\n"
+        "• Your `/settings` (images on/off, history opt-in)\n"
+        "• Reading history **only if you opt in**\n"
+        "• Whether you’ve visited `/insight` before (for greetings)\n\n"
+        "**Delete everything:** use `/forgetme`.\n"
+        "Arcanara does not read server messages or DMs."
+    ),
+    color=0x6A5ACD,
+)
+
+
 @bot.tree.command(name="privacy", description="What Arcanara stores and how to delete it.")
 async def privacy_slash(interaction: discord.Interaction):
-    embed = discord.Embed(
-        title="🔒 Arcanara Privacy",
-        description=(
-            "**Stored data (optional / minimal):**\n"
-            "• Your chosen `/tone`\n"
-            "• Your `/settings` (images on/off, history opt-in)\n"
-            "• Reading history **only if you opt in**\n\n"
-            "**Delete everything:** use `/forgetme`.\n"
-            "Arcanara does not read server messages or DMs."
-        ),
-        color=0x6A5ACD,
-    )
-    await send_ephemeral(interaction, embed=embed, mood="general")
+    if not await safe_defer(interaction, ephemeral=True):
+        return
+
+    await send_ephemeral(interaction, embed=PRIVACY_EMBED.copy(), mood="general")
+
+
+def delete_user_data(user_id: int) -> None:
+    # Rows still queued for history_flusher are dropped by _insert_history_rows;
+    # holding the write lock means no COPY can land after these DELETEs.
+    _FORGOTTEN_AT[user_id] = time.monotonic()
+    with _HISTORY_WRITE_LOCK:
+        # Pipeline mode sends all the DELETEs in one round-trip
+        with db_connect() as conn:
+            with conn.pipeline(), conn.cursor() as cur:
+                cur.execute("DELETE FROM tarot_user_prefs WHERE user_id=%s", (user_id,))
+                cur.execute("DELETE FROM tarot_user_settings WHERE user_id=%s", (user_id,))
+                cur.execute("DELETE FROM tarot_reading_history WHERE user_id=%s", (user_id,))
+                cur.execute("DELETE FROM tarot_seekers WHERE user_id=%s", (user_id,))
+            conn.commit()
+
+
+async def forget_user(user_id: int) -> None:
+    """Delete everything Arcanara keeps for a user, in the DB and in memory."""
+    await asyncio.to_thread(delete_user_data, user_id)
+
+    invalidate_user_cache(user_id)
+    _KNOWN_SEEKER_IDS.discard(user_id)
+    user_intentions.pop(user_id, None)
+    MYSTERY_STATE.pop(user_id, None)
 
 
 @bot.tree.command(name="forgetme", description="Delete your stored Arcanara data.")
@@ -1837,17 +2345,7 @@ async def forgetme_slash(interaction: discord.Interaction):
     if not await safe_defer(interaction, ephemeral=True):
         return
         
-    uid = interaction.user.id
-
-    with db_connect() as conn:
-        with conn.cursor() as cur:
-            cur.execute("DELETE FROM tarot_user_prefs WHERE user_id=%s", (uid,))
-            cur.execute("DELETE FROM tarot_user_settings WHERE user_id=%s", (uid,))
-            cur.execute("DELETE FROM tarot_reading_history WHERE user_id=%s", (uid,))
-        conn.commit()
-
-    user_intentions.pop(uid, None)
-    MYSTERY_STATE.pop(uid, None)
+    await forget_user(interaction.user.id)
 
     await send_ephemeral(interaction, content="✅ Your thread has been cut clean. Stored data deleted.", mood="general")
 
@@ -1867,8 +2365,7 @@ async def settings_slash(
     h = None if history is None else (history.value == "on")
     i = None if images is None else (images.value == "on")
 
-    set_user_settings(interaction.user.id, history_opt_in=h, images_enabled=i)
-    s = get_user_settings(interaction.user.id)
+    s = set_user_settings(interaction.user.id, history_opt_in=h, images_enabled=i)
 
     await send_ephemeral(
         interaction,
@@ -1884,4 +2381,7 @@ async def settings_slash(
 # ==============================
 # RUN BOT
 # ==============================
-bot.run(BOT_TOKEN)
+if __name__ == "__main__":
+    bot.run(BOT_TOKEN)
+    drain_history_queue()
+    DB_POOL.close()
@@ -1,5 +1,6 @@
 # card_images.py
 import os, re, json, io
+from functools import lru_cache
 import discord
 
 # Optional rotate/resize for reversed & large images
@@ -12,17 +13,19 @@ except Exception:
 BASE_DIR  = os.path.dirname(os.path.abspath(__file__))
 IMAGE_DIR = os.path.join(BASE_DIR, "assets", "cards")
 _ALLOWED_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")  # "_" is in the class, so runs come out collapsed
 
+@lru_cache(maxsize=256)
 def card_slug(name: str) -> str:
     s = name.lower()
     s = s.replace("—","-").replace("’","").replace("'","")
-    s = re.sub(r"[^a-z0-9]+","_", s)
-    return re.sub(r"_+","_", s).strip("_")
+    return _SLUG_NONALNUM.sub("_", s).strip("_")
 
 def _load_manifest(path):
+    """Manifest keyed by card_slug(name), so lookups don't have to guess the key's casing."""
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return {card_slug(k): v for k, v in json.load(f).items()}
     except Exception:
         return {}
 
@@ -30,31 +33,41 @@ TEST_MANIFEST    = _load_manifest(os.path.join(IMAGE_DIR, "test",    "manifest.j
 RWS_STX_MANIFEST = _load_manifest(os.path.join(IMAGE_DIR, "rws_stx", "manifest.json"))
 RWS_MANIFEST     = _load_manifest(os.path.join(IMAGE_DIR, "rws",     "manifest.json"))  # if you later add a different RWS set
 
+def _scan_folder(folder: str) -> dict[str, str]:
+    """filename -> full path for every file directly in IMAGE_DIR/folder ("" is IMAGE_DIR itself)."""
+    try:
+        with os.scandir(os.path.join(IMAGE_DIR, folder)) as it:
+            return {e.name: e.path for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+# One directory listing per folder at import instead of a stat() per extension per lookup
+_FOLDER_FILES = {folder: _scan_folder(folder) for folder in ("test", "rws_stx", "rws", "")}
+
 def _resolve_in_folder(folder: str, name_or_base: str) -> str | None:
     """Return a real path if it exists. Supports names with or without extension."""
+    files = _FOLDER_FILES.get(folder) or {}
     base, ext = os.path.splitext(name_or_base)
     # If user passed something with extension, try it directly
     if ext:
-        p = os.path.join(IMAGE_DIR, folder, name_or_base)
-        return p if os.path.exists(p) else None
+        return files.get(name_or_base)
     # Try each allowed extension
     for e in _ALLOWED_EXTS:
-        p = os.path.join(IMAGE_DIR, folder, base + e)
-        if os.path.exists(p):
+        p = files.get(base + e)
+        if p:
             return p
     return None
 
 def _manifest_lookup(manifest: dict, card_name: str, folder: str) -> str | None:
-    for key in (card_name, card_name.title(), card_name.upper()):
-        v = manifest.get(key)
-        if v:
-            p = _resolve_in_folder(folder, v)
-            if p:
-                return p
-    return None
+    v = manifest.get(card_slug(card_name))
+    return _resolve_in_folder(folder, v) if v else None
 
+@lru_cache(maxsize=256)
 def local_card_path(card_name: str) -> str | None:
-    """Find the best local image path for a given card (your test art > Sacred-Texts set > other)."""
+    """
+    Find the best local image path for a given card (your test art > Sacred-Texts set > other).
+    Card art doesn't move while the bot runs, so each name is resolved once.
+    """
     slug = card_slug(card_name)
 
     # 1) Your test images (highest priority)
@@ -79,38 +92,60 @@ def local_card_path(card_name: str) -> str | None:
     if p: return p
 
     # 4) Last-ditch: look directly in assets/cards/
-    for e in _ALLOWED_EXTS:
-        q = os.path.join(IMAGE_DIR, f"{slug}{e}")
-        if os.path.exists(q):
-            return q
-    return None
+    return _resolve_in_folder("", slug)
 
-def make_image_attachment(card_name: str, reversed_flag: bool = False, max_width: int = 900):
-    """
-    Returns (discord.File or None, 'attachment://...' or None).
-    If Pillow is available, rotates for reversed and gently downsizes very large images.
-    """
+@lru_cache(maxsize=256)
+def _attachment_bytes(card_name: str, reversed_flag: bool, max_width: int) -> tuple[bytes, str] | None:
+    """Encoded image bytes + filename for one card/orientation. Card art is static, so cache it."""
     path = local_card_path(card_name)
     if not path:
-        return None, None
+        return None
 
     # No PIL fallback: attach as-is
     if not PIL_OK:
-        fn = os.path.basename(path)
-        return discord.File(path, filename=fn), f"attachment://{fn}"
+        with open(path, "rb") as f:
+            return f.read(), os.path.basename(path)
 
-    # PIL flow: open → optional rotate → optional downscale → PNG buffer
+    # PIL flow: open → optional downscale → optional rotate → JPEG (or PNG if transparent) buffer
     with Image.open(path) as im:
-        im = im.convert("RGBA")
-        if reversed_flag:
-            im = im.rotate(180, expand=True)
+        # Image.open only reads the header; upright art that already fits is sent as-is
+        if not reversed_flag and not (max_width and im.width > max_width):
+            with open(path, "rb") as f:
+                return f.read(), os.path.basename(path)
 
         if max_width and im.width > max_width:
-            ratio = max_width / im.width
-            im = im.resize((max_width, int(im.height * ratio)), Image.LANCZOS)
+            # thumbnail() keeps the aspect ratio and lets JPEGs decode at a reduced
+            # scale (draft) before the LANCZOS pass, instead of decoding full size
+            im.thumbnail((max_width, im.height), Image.LANCZOS)
+
+        # Card scans are opaque, and JPEG encodes several times faster than PNG (and smaller);
+        # keep PNG only for art that actually uses transparency
+        if im.mode == "P" and "transparency" in im.info:
+            im = im.convert("RGBA")
+        keep_alpha = im.mode in ("RGBA", "LA") and im.getextrema()[-1][0] < 255
+        if not keep_alpha and im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+        if reversed_flag:
+            im = im.transpose(Image.Transpose.ROTATE_180)  # pixel flip, no resampling
 
         buf = io.BytesIO()
-        im.save(buf, format="PNG")  # embeds love PNG
-        buf.seek(0)
-        out_name = f"{card_slug(card_name)}{'_rev' if reversed_flag else ''}.png"
-        return discord.File(buf, filename=out_name), f"attachment://{out_name}"
\ No newline at end of file
+        if keep_alpha:
+            im.save(buf, format="PNG")
+            ext = "png"
+        else:
+            im.save(buf, format="JPEG", quality=88)
+            ext = "jpg"
+        out_name = f"{card_slug(card_name)}{'_rev' if reversed_flag else ''}.{ext}"
+        return buf.getvalue(), out_name
+
+def make_image_attachment(card_name: str, reversed_flag: bool = False, max_width: int = 900):
+    """
+    Returns (discord.File or None, 'attachment://...' or None).
+    If Pillow is available, rotates for reversed and gently downsizes very large images.
+    The encoded bytes are cached; each call wraps them in a fresh File (discord.py consumes it).
+    """
+    cached = _attachment_bytes(card_name, reversed_flag, max_width)
+    if cached is None:
+        return None, None
+    data, out_name = cached
+    return discord.File(io.BytesIO(data), filename=out_name), f"attachment://{out_name}"
\ No newline at end of file
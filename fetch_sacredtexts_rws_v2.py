@@ -5,20 +5,27 @@ Download Rider–Waite 'Pictorial Key' images from Sacred Texts (stdlib only).
 Fixes: reads <img src=...> on each card page, normalizes titles.
 
 Output:
-  assets/cards/rws_stx/ (images + manifest.json + report.csv)
+  assets/cards/rws_stx/ (images + manifest.json + http_cache.json + report.csv)
 """
 
-import os, re, csv, json, time, unicodedata
+import os, re, csv, json, time, threading, unicodedata
+import http.client
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
+from urllib.error import HTTPError
 from urllib.parse import urljoin, urlparse
-from urllib.request import urlopen, Request
+from urllib.robotparser import RobotFileParser
 
 INDEX_URL     = "https://www.sacred-texts.com/tarot/xr/index.htm"
 RWS_IMG_ROOT  = "/tarot/pkt/"          # accept anything under /tarot/pkt/ (color plates)
 OUT_DIR       = os.path.join("assets", "cards", "rws_stx")
+HTTP_CACHE    = os.path.join(OUT_DIR, "http_cache.json")   # image URL -> ETag / Last-Modified from the last run
 USER_AGENT    = "ArcanaraTarotFetcher/2.0 (+personal use)"
-PAUSE         = 0.12
+PAUSE         = 0.12                  # min spacing between request starts per host (or robots.txt Crawl-delay if longer)
+WORKERS       = 4
 IMG_EXTS      = (".jpg",".jpeg",".png",".webp")
+MAX_IMG_BYTES = 20 * 1024 * 1024      # sanity cap; a card scan is a few hundred KB
+CHUNK         = 64 * 1024
 
 MAJORS = [
     "The Fool","The Magician","The High Priestess","The Empress","The Emperor","The Hierophant",
@@ -29,31 +36,176 @@ RANKS_NUM   = ["Ace","Two","Three","Four","Five","Six","Seven","Eight","Nine","T
 RANKS_COURT = ["Page","Knight","Queen","King"]
 SUITS = ["Cups","Pentacles","Swords","Wands"]
 
-EXPECTED = set(MAJORS +
-               [f"{r} of {s}" for s in SUITS for r in RANKS_NUM] +
-               [f"{r} of {s}" for s in SUITS for r in RANKS_COURT])
+MAJORS_SET = frozenset(MAJORS)   # hashed membership for the index filter
+EXPECTED = frozenset(MAJORS +
+                     [f"{r} of {s}" for s in SUITS for r in RANKS_NUM] +
+                     [f"{r} of {s}" for s in SUITS for r in RANKS_COURT])
+
+WS_RE        = re.compile(r"\s+")
+NEXT_PREV_RE = re.compile(r"^(?:«\s*)?(?:next|previous):\s*tarot card cross-reference--", re.I)
+LEAD_NUM_RE  = re.compile(r"^\d+\.\s*")
 
 def norm_ws(s: str) -> str:
     s = unicodedata.normalize("NFKC", s or "")
-    return re.sub(r"\s+", " ", s.strip())
+    return WS_RE.sub(" ", s.strip())
+
+SLUG_NONALNUM_RE = re.compile(r"[^a-z0-9]+")  # "_" is in the class, so runs come out collapsed
 
 def slug(s: str) -> str:
     s = s.lower().replace("—","-").replace("’","").replace("'","")
-    s = re.sub(r"[^a-z0-9]+","_", s)
-    return re.sub(r"_+","_", s).strip("_")
+    return SLUG_NONALNUM_RE.sub("_", s).strip("_")
+
+class Throttle:
+    """Thread-safe spacing of request starts: overlaps latency without raising the request rate."""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+_LOCAL = threading.local()
+REDIRECTS = (301, 302, 303, 307, 308)
+
+def _connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    """This thread's kept-alive connection to netloc: one TCP+TLS handshake per worker per host."""
+    conns = getattr(_LOCAL, "conns", None)
+    if conns is None:
+        conns = _LOCAL.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conns[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    elif conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    conn.timeout = timeout
+    return conn
+
+def _drop_connection(url: str):
+    """Close this thread's connection to url's host, e.g. after abandoning a response mid-body."""
+    parts = urlparse(url)
+    conn = getattr(_LOCAL, "conns", {}).pop((parts.scheme, parts.netloc), None)
+    if conn is not None:
+        conn.close()
+
+def http_open(url: str, headers: dict | None = None, timeout: float = 60) -> http.client.HTTPResponse:
+    """
+    GET url on a reused connection, following redirects. Read the response to the
+    end before this thread's next request. Non-2xx statuses raise HTTPError, as urlopen does.
+    """
+    hdrs = {"User-Agent": USER_AGENT, **(headers or {})}
+    for _ in range(5):
+        parts = urlparse(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conn = _connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request("GET", path, headers=hdrs)
+            r = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            # the server dropped the idle keep-alive connection; reconnect once
+            conn.close()
+            conn.request("GET", path, headers=hdrs)
+            r = conn.getresponse()
+        if r.status in REDIRECTS and r.getheader("Location"):
+            r.read()
+            url = urljoin(url, r.getheader("Location"))
+            continue
+        if r.status >= 300:
+            r.read()
+            raise HTTPError(url, r.status, r.reason, r.headers, None)
+        return r
+    raise HTTPError(url, 310, "Too many redirects", None, None)
+
+_HOSTS_LOCK = threading.Lock()
+_ROBOTS: dict[str, RobotFileParser] = {}
+_THROTTLES: dict[str, Throttle] = {}
+
+def _host_policy(url: str) -> tuple[RobotFileParser, Throttle]:
+    """robots.txt rules + request throttle for url's host, set up once per host."""
+    parts = urlparse(url)
+    root = f"{parts.scheme}://{parts.netloc}"
+    with _HOSTS_LOCK:
+        if root not in _ROBOTS:
+            rp = RobotFileParser(root + "/robots.txt")
+            try:
+                with http_open(rp.url, timeout=30) as r:
+                    rp.parse(r.read().decode("utf-8", errors="ignore").splitlines())
+            except HTTPError as e:
+                # like RobotFileParser.read(): auth errors mean keep out, a missing file means anything goes
+                if e.code in (401, 403):
+                    rp.disallow_all = True
+                else:
+                    rp.allow_all = True
+            except Exception:
+                rp.allow_all = True
+            _ROBOTS[root] = rp
+            _THROTTLES[root] = Throttle(max(PAUSE, float(rp.crawl_delay(USER_AGENT) or 0)))
+        return _ROBOTS[root], _THROTTLES[root]
+
+def _polite(url: str) -> bool:
+    """Check robots.txt, then wait for this host's throttle. False means don't fetch."""
+    rp, throttle = _host_policy(url)
+    if not rp.can_fetch(USER_AGENT, url):
+        print(f"robots.txt disallows {url}; skipping")
+        return False
+    throttle.wait()
+    return True
 
 def http_get_text(url: str) -> str:
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    with urlopen(req, timeout=60) as r:
+    if not _polite(url):
+        return ""
+    with http_open(url, timeout=60) as r:
         return r.read().decode("utf-8", errors="ignore")
 
-def http_get_bytes(url: str) -> bytes | None:
+def http_download(url: str, dest: str, cached: dict | None = None) -> tuple[bool | None, dict]:
+    """
+    Stream an image into dest (atomically, via dest + ".tmp") -> (changed, validators).
+    With `cached` validators the request is conditional; an unchanged image comes
+    back as (False, cached) with dest untouched. Failures return (None, {}).
+    """
+    if not _polite(url):
+        return None, {}
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("lastmod"):
+            headers["If-Modified-Since"] = cached["lastmod"]
+    tmp = dest + ".tmp"
     try:
-        req = Request(url, headers={"User-Agent": USER_AGENT})
-        with urlopen(req, timeout=120) as r:
-            return r.read()
+        with http_open(url, headers, timeout=120) as r, open(tmp, "wb") as f:
+            total = 0
+            while chunk := r.read(CHUNK):
+                total += len(chunk)
+                if total > MAX_IMG_BYTES:
+                    raise ValueError(f"{url} is over {MAX_IMG_BYTES} bytes")
+                f.write(chunk)
+            validators = {"etag": r.headers.get("ETag"), "lastmod": r.headers.get("Last-Modified")}
+        if not total:
+            raise ValueError(f"{url} returned an empty body")
+        os.replace(tmp, dest)
+        return True, validators
+    except HTTPError as e:
+        if e.code == 304 and cached:
+            return False, cached
+        return None, {}
     except Exception:
-        return None
+        _drop_connection(url)  # the stream may be left mid-body
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return None, {}
+
+def load_http_cache() -> dict:
+    try:
+        with open(HTTP_CACHE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
 
 class AAndIMGCollector(HTMLParser):
     def __init__(self):
@@ -90,16 +242,41 @@ def parse_assets(html: str):
     p.feed(html)
     return p.a, p.img
 
+def is_rws_image(abs_url: str) -> bool:
+    path = urlparse(abs_url).path
+    return path.startswith(RWS_IMG_ROOT) and path.lower().endswith(IMG_EXTS)
+
+class _FoundImage(Exception):
+    pass
+
+class CardImageFinder(HTMLParser):
+    """Stops parsing at the first Pictorial Key <img>; keeps <a href>s seen so far for the fallback."""
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url
+        self.hrefs = []
+    def handle_starttag(self, tag, attrs):
+        if tag == "img":
+            src = dict(attrs).get("src")
+            if src:
+                absu = urljoin(self.base_url, src)
+                if is_rws_image(absu):
+                    raise _FoundImage(absu)
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.hrefs.append(href)
+
 def canonical_card_name(s: str) -> str | None:
     """Normalize titles from index (removes Next/Previous, numbering, fixes Judgment spelling, maps 'The Wheel...'→'Wheel...' etc.)."""
     if not s:
         return None
     t = norm_ws(s)
     # strip "Next:" / "Previous:" boilerplate that sometimes appears on link text
-    t = re.sub(r"^(?:«\s*)?(?:next|previous):\s*tarot card cross-reference--", "", t, flags=re.I)
+    t = NEXT_PREV_RE.sub("", t)
     t = t.replace("Â»","").strip("«» ").strip()
     # drop leading "NN. "
-    t = re.sub(r"^\d+\.\s*", "", t)
+    t = LEAD_NUM_RE.sub("", t)
     # Judgment spelling
     t = t.replace("Judgment", "Judgement")
     # 'The Wheel of Fortune' → 'Wheel of Fortune' (canonical in our list)
@@ -121,7 +298,7 @@ def get_card_pages_from_index() -> list[tuple[str,str]]:
         if not name:
             continue
         # keep only likely card names
-        if (" of " in name) or (name in MAJORS):
+        if (" of " in name) or (name in MAJORS_SET):
             cards.append((name, urljoin(INDEX_URL, href)))
     # de-dupe by name (last wins)
     seen = {}
@@ -132,24 +309,45 @@ def get_card_pages_from_index() -> list[tuple[str,str]]:
 def find_rws_image_on_card_page(card_page_url: str) -> str | None:
     """Return absolute URL of the Pictorial Key card image found via <img src> (preferred) or <a href> fallback."""
     html = http_get_text(card_page_url)
-    anchors, images = parse_assets(html)
+    p = CardImageFinder(card_page_url)
 
-    # 1) look at <img src>
-    for src, alt in images:
-        absu = urljoin(card_page_url, src)
-        path = urlparse(absu).path
-        if path.startswith(RWS_IMG_ROOT) and path.lower().endswith(IMG_EXTS):
-            return absu
+    # 1) look at <img src>, stopping at the first match
+    try:
+        p.feed(html)
+        p.close()
+    except _FoundImage as found:
+        return found.args[0]
 
-    # 2) fallback: look at <a href> that point directly to images
-    for href, _txt in anchors:
-        absu = urljoin(card_page_url, href or "")
-        path = urlparse(absu).path
-        if path.startswith(RWS_IMG_ROOT) and path.lower().endswith(IMG_EXTS):
+    # 2) fallback: look at <a href> that point directly to images (the whole page was read)
+    for href in p.hrefs:
+        absu = urljoin(card_page_url, href)
+        if is_rws_image(absu):
             return absu
 
     return None
 
+def fetch_card(name: str, page_url: str, http_cache: dict):
+    """
+    Fetch one card page + image. `name` is already canonical (get_card_pages_from_index).
+    Returns (name, filename, None, (img_url, validators)) or (name, None, (label, url), None) on failure.
+    """
+    img_url = find_rws_image_on_card_page(page_url)
+    if not img_url:
+        return name, None, (name, page_url), None
+
+    ext = os.path.splitext(urlparse(img_url).path)[1].lower()
+    if ext not in IMG_EXTS:
+        ext = ".jpg"
+    filename = slug(name) + ext
+    dest = os.path.join(OUT_DIR, filename)
+
+    # Only revalidate when the file from the last run is still on disk
+    cached = http_cache.get(img_url) if os.path.exists(dest) else None
+    changed, validators = http_download(img_url, dest, cached)
+    if changed is None:
+        return name, None, (name + " (download failed) ", img_url), None
+    return name, filename, None, (img_url, validators)
+
 def main():
     os.makedirs(OUT_DIR, exist_ok=True)
     cards = get_card_pages_from_index()
@@ -157,35 +355,19 @@ def main():
 
     manifest = {}
     extras = []
-    for i, (name_raw, page_url) in enumerate(cards, 1):
-        name = canonical_card_name(name_raw) or name_raw
-        print(f"[{i:02d}/{len(cards)}] {name}")
-
-        img_url = find_rws_image_on_card_page(page_url)
-        if not img_url:
-            extras.append((name, page_url))
-            time.sleep(PAUSE); continue
-
-        ext = os.path.splitext(urlparse(img_url).path)[1].lower()
-        if ext not in IMG_EXTS:
-            ext = ".jpg"
-        filename = slug(name) + ext
-        dest = os.path.join(OUT_DIR, filename)
-
-        data = http_get_bytes(img_url)
-        if not data:
-            extras.append((name + " (download failed) ", img_url))
-            time.sleep(PAUSE); continue
-
-        tmp = dest + ".tmp"
-        with open(tmp, "wb") as f:
-            f.write(data)
-        if os.path.exists(dest):
-            os.remove(dest)
-        os.replace(tmp, dest)
-
-        manifest[name] = filename
-        time.sleep(PAUSE)
+    old_cache = load_http_cache()
+    http_cache = {}
+    # A few workers overlap network latency; the per-host throttles keep the request rate where it was
+    with ThreadPoolExecutor(max_workers=WORKERS) as ex:
+        results = ex.map(lambda card: fetch_card(*card, old_cache), cards)
+        for i, (name, filename, extra, validated) in enumerate(results, 1):
+            print(f"[{i:02d}/{len(cards)}] {name}")
+            if extra:
+                extras.append(extra)
+            else:
+                manifest[name] = filename
+                img_url, validators = validated
+                http_cache[img_url] = validators
 
     got = set(manifest.keys())
     missing = sorted(list(EXPECTED - got))
@@ -193,6 +375,9 @@ def main():
     with open(os.path.join(OUT_DIR, "manifest.json"), "w", encoding="utf-8") as f:
         json.dump(manifest, f, ensure_ascii=False, indent=2)
 
+    with open(HTTP_CACHE, "w", encoding="utf-8") as f:
+        json.dump(http_cache, f, ensure_ascii=False, indent=2)
+
     with open(os.path.join(OUT_DIR, "report.csv"), "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f); w.writerow(["status","card_or_file","source"])
         for m in missing: w.writerow(["missing", m, ""])
@@ -0,0 +1,100 @@
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+class FakeCopy:
+    def __init__(self, written):
+        self.written = written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.written.append(row)
+
+
+class FakeCursor:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.pool.executed.append((sql, params))
+
+    def copy(self, sql):
+        return FakeCopy(self.pool.copied)
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return FakeCursor(self.pool)
+
+    def pipeline(self):
+        return self
+
+    def commit(self):
+        pass
+
+
+class FakePool:
+    """Stands in for psycopg_pool.ConnectionPool; records what would hit Postgres."""
+
+    def __init__(self, *args, **kwargs):
+        self.executed = []
+        self.copied = []
+
+    @staticmethod
+    def check_connection(conn):
+        pass
+
+    def connection(self):
+        return FakeConnection(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def bot_module():
+    pytest.importorskip("discord")
+    psycopg_pool = pytest.importorskip("psycopg_pool")
+
+    os.environ["BOT_TOKEN"] = os.environ.get("BOT_TOKEN") or "test-token"
+    os.environ["DATABASE_URL"] = os.environ.get("DATABASE_URL") or "postgresql://localhost/arcanara-test"
+    real_pool = psycopg_pool.ConnectionPool
+    psycopg_pool.ConnectionPool = FakePool
+    try:
+        return importlib.import_module("arcanara_bot")
+    finally:
+        psycopg_pool.ConnectionPool = real_pool
+
+
+@pytest.fixture
+def db(bot_module):
+    pool = bot_module.DB_POOL
+    pool.executed.clear()
+    pool.copied.clear()
+    return pool
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+OPTED_IN = {"history_opt_in": True}
+
+
+@pytest.fixture(autouse=True)
+def fresh_queue(bot_module, monkeypatch):
+    # Each test runs its own event loop; the module-level queue binds to the first one
+    monkeypatch.setattr(bot_module, "_HISTORY_QUEUE", asyncio.Queue())
+
+
+async def _flush(bot, db, expected_rows):
+    # Run the real flusher until the rows we expect have been COPYed
+    flusher = asyncio.create_task(bot.history_flusher())
+    try:
+        for _ in range(200):
+            if len(db.copied) >= expected_rows:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        flusher.cancel()
+
+
+def test_forgetme_drops_queued_history(bot_module, db, monkeypatch):
+    bot = bot_module
+    monkeypatch.setattr(bot, "HISTORY_FLUSH_INTERVAL", 0.05)
+
+    async def scenario():
+        bot.log_history_if_opted_in(101, "draw", "poetic", {"n": 1}, settings=OPTED_IN)
+        await bot.forget_user(101)
+        # Another seeker's row shows the flusher actually ran
+        bot.log_history_if_opted_in(202, "draw", "poetic", {"n": 2}, settings=OPTED_IN)
+        await _flush(bot, db, 1)
+
+    asyncio.run(scenario())
+
+    assert [row[0] for row in db.copied] == [202]
+    assert ("DELETE FROM tarot_reading_history WHERE user_id=%s", (101,)) in db.executed
+
+
+def test_forgetme_drops_rows_the_flusher_already_took(bot_module, db, monkeypatch):
+    bot = bot_module
+    monkeypatch.setattr(bot, "HISTORY_FLUSH_INTERVAL", 0.2)
+
+    async def scenario():
+        flusher = asyncio.create_task(bot.history_flusher())
+        try:
+            bot.log_history_if_opted_in(303, "read", "poetic", {"n": 1}, settings=OPTED_IN)
+            await asyncio.sleep(0.05)  # the flusher is now holding the row in its batch
+            assert bot._HISTORY_QUEUE.empty()
+            await bot.forget_user(303)
+            bot.log_history_if_opted_in(404, "read", "poetic", {"n": 2}, settings=OPTED_IN)
+            for _ in range(200):
+                if db.copied:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            flusher.cancel()
+
+    asyncio.run(scenario())
+
+    assert [row[0] for row in db.copied] == [404]
+
+
+def test_history_after_forgetme_is_kept(bot_module, db, monkeypatch):
+    bot = bot_module
+    monkeypatch.setattr(bot, "HISTORY_FLUSH_INTERVAL", 0.05)
+
+    async def scenario():
+        await bot.forget_user(505)
+        await asyncio.sleep(0.05)  # step past coarse monotonic clocks
+        bot.log_history_if_opted_in(505, "draw", "poetic", {"n": 1}, settings=OPTED_IN)
+        await _flush(bot, db, 1)
+
+    asyncio.run(scenario())
+
+    assert [row[0] for row in db.copied] == [505]
+
+
+def test_cancelled_flusher_writes_its_batch(bot_module, db, monkeypatch):
+    bot = bot_module
+    monkeypatch.setattr(bot, "HISTORY_FLUSH_INTERVAL", 30.0)
+
+    async def scenario():
+        flusher = asyncio.create_task(bot.history_flusher())
+        bot.log_history_if_opted_in(606, "celtic", "poetic", {"n": 1}, settings=OPTED_IN)
+        await asyncio.sleep(0.05)  # the flusher is lingering with the row in its batch
+        assert bot._HISTORY_QUEUE.empty() and not db.copied
+        bot.log_history_if_opted_in(707, "celtic", "poetic", {"n": 2}, settings=OPTED_IN)
+        await asyncio.sleep(0.05)
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+    assert [row[0] for row in db.copied] == [606, 707]
+
+
+def test_drain_writes_rows_left_on_the_queue(bot_module, db):
+    bot = bot_module
+    bot.log_history_if_opted_in(808, "read", "poetic", {"n": 1}, settings=OPTED_IN)
+    bot.drain_history_queue()
+
+    assert [row[0] for row in db.copied] == [808]
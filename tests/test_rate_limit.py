@@ -0,0 +1,18 @@
+def test_user_limit_and_idle_windows_expire(bot_module, monkeypatch):
+    bot = bot_module
+    clock = [1000.0]
+    monkeypatch.setattr(bot.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(bot, "USER_RPM", 2)
+
+    assert bot.rate_limit_retry_after(7, None) is None
+    clock[0] += 10
+    assert bot.rate_limit_retry_after(7, None) is None
+    clock[0] += 10
+    assert bot.rate_limit_retry_after(7, None) == 40.0
+    assert len(bot._USER_WINDOW._data) == 1
+
+    # A full window after the newest stamp the entry is gone, not an empty deque
+    clock[0] += bot.RATE_WINDOW - 10
+    assert bot._USER_WINDOW.get(7) is None
+    assert len(bot._USER_WINDOW._data) == 0
+    assert bot.rate_limit_retry_after(7, None) is None
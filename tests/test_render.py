@@ -0,0 +1,64 @@
+def test_empty_fields(bot_module):
+    bot = bot_module
+    card = {
+        "name": "Blank Test Card",
+        "upright": {"meaning": "", "voice": {"lead_in": "", "pulse": "  "}},
+        "direct_guidance": {
+            "mantra": "",
+            "do": "Breathe.",
+            "dont": "",
+            "questions": ["", "   "],
+            "green_flag": "",
+            "red_flag": "",
+        },
+        "call_to_action": "",
+    }
+
+    # An empty meaning still renders as "—"; empty optional fields add nothing
+    assert bot.render_card_text(card, "Upright", "poetic") == "—"
+    assert bot.render_card_text(card, "Upright", "full") == "—\n\nBreathe."
+    assert bot.render_card_text(card, "Upright", "quick") == ""
+    assert bot.render_card_text({"name": "Bare"}, "Reversed", "poetic") == "—"
+
+
+def test_deck_cards_match_uncached_render(bot_module):
+    bot = bot_module
+    card = bot.tarot_cards[0]
+    for orientation in bot.ORIENTATIONS:
+        for tone in bot.TONE_SPECS:
+            uncached = bot._join_blocks(bot.prerender_blocks(dict(card), orientation), tone)
+            assert bot.render_card_text(card, orientation, tone) == uncached
+
+
+def test_spread_fields_clip_at_1000(bot_module):
+    bot = bot_module
+
+    def field_text(meaning_len):
+        card = {"name": "Long Test Card", "upright": {"meaning": "x" * meaning_len}}
+        [(_pos, _pretty, _card, _orientation, text)] = bot.render_spread(
+            ("Situation",), ("Situation",), [(card, "Upright")], "poetic"
+        )
+        return text
+
+    # Exactly 1000 characters fits a spread field untouched
+    assert field_text(1000) == "x" * 1000
+    # Longer text is cut to 999 characters plus a single "…"
+    assert field_text(1001) == "x" * 999 + "…"
+    assert len(field_text(5000)) == 1000
+
+
+def test_find_card_by_query_order(bot_module):
+    find = bot_module.find_card_by_query
+
+    # Exact normalized name wins, whatever the case, spacing or number style
+    assert find("  THE   lovers!")["name"] == "The Lovers"
+    assert find("2 of cups")["name"] == "Two of Cups"
+    assert find("King of Cups")["name"] == "King of Cups"
+    # Then a prefix: an ambiguous one resolves to the alphabetically first name,
+    # not to the first match in deck order (The Fool)
+    assert find("the")["name"] == "The Chariot"
+    assert find("the s")["name"] == "The Star"
+    # Then a substring anywhere, in deck order
+    assert find("lovers")["name"] == "The Lovers"
+    assert find("of cups")["name"] == "Two of Cups"
+    assert find("zzz") is None